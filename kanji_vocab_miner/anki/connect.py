@@ -1,14 +1,18 @@
+import math
 import re
 import requests
-import json
-from typing import List, Dict, Set, Any, Optional, Tuple
-import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
 # Update import to avoid circular dependency
-from kanji_vocab_miner.utils import is_kanji
+from kanji_vocab_miner.utils import chunked
 from kanji_vocab_miner.anki.schemas import KanjiCard
 from kanji_vocab_miner.jisho import JishoWord, fetch_jisho_word_furigana
 from kanji_vocab_miner.config import (
+    get_cache_dir,
     load_config,
     VOCAB_DECK_NAME,
     VOCAB_NOTE_TYPE,
@@ -16,10 +20,81 @@ from kanji_vocab_miner.config import (
     FIELDS,
 )
 
-from tqdm import tqdm
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+REQUEST_TIMEOUT = (2, 30)  # (connect, read) seconds
+
+# Large decks return thousands of notes; fetch their info a slice at a time
+NOTES_INFO_CHUNK_SIZE = 500
+
+# Furigana lookups are independent Jisho requests; cap how many run at once
+PREPARE_NOTE_WORKERS = 8
+PROGRESS_BAR_MIN_NOTES = 20
+
+# Identical read-only requests within this window are answered from memory.
+# guiCurrentCard is left out because it tracks what the Anki window is showing,
+# and notesInfo because iter_notes_info streams it in chunks that caching would
+# keep alive all at once.
+REQUEST_CACHE_TTL = 2.0  # seconds
+_CACHEABLE_ACTIONS = frozenset(
+    {"findCards", "findNotes", "cardsInfo", "deckNames", "modelNames"}
+)
+# Actions that change what a read returns; only these clear the cache, so
+# uncached reads like notesInfo or guiCurrentCard leave cached results alone.
+# multi is included because its sub-actions are not inspected when sent directly.
+_MUTATING_ACTIONS = frozenset(
+    {
+        "addNote",
+        "addNotes",
+        "updateNote",
+        "updateNoteFields",
+        "updateNoteTags",
+        "addTags",
+        "removeTags",
+        "deleteNotes",
+        "changeDeck",
+        "createDeck",
+        "deleteDecks",
+        "createModel",
+        "setSpecificValueOfCard",
+        "setDueDate",
+        "forgetCards",
+        "relearnCards",
+        "suspend",
+        "unsuspend",
+        "answerCards",
+        "guiAnswerCard",
+        "importPackage",
+        "sync",
+        "multi",
+    }
+)
+_request_cache: Dict[Tuple[str, bytes], Tuple[float, Any]] = {}
+_request_cache_lock = threading.Lock()
+
+# Reviewed kanji keyed by note ID, stored with each note's modification time,
+# so later runs only fetch notes that are new or were edited since
+REVIEWED_KANJI_CACHE_FILE = "reviewed_kanji.json"
 
-# Lazy-loaded configuration
+# Cleared by --no-cache; the refreshed kanji are still written back to disk
+_cache_lookups_enabled = True
+
+# Furigana markup patterns, compiled once since they run for every vocab card
+_LEGACY_MARKER_RE = re.compile(r"[\u4E00-\u9FFF]\[")
+_LEGACY_FURIGANA_RE = re.compile(r"([\u4E00-\u9FFF])\[([^\]]+)\]")
+_KANA_TRAILING_SPACE_RE = re.compile(r"([\u3040-\u309F]) ")
+_RUBY_RE = re.compile(r"<ruby>([\u4E00-\u9FFF])<rt([^>]*)>(.*?)</rt></ruby>")
+
+# Wrapper tags Anki's editor adds around hand-edited field values
+_FIELD_WRAPPER_RE = re.compile(r"</?div>|<br\s*/?>", re.IGNORECASE)
+
+# Lazy-loaded configuration and HTTP session
 _config = None
+_session = None
+# Notes are prepared on worker threads, so the session is created under a lock
+_session_lock = threading.Lock()
 
 
 def get_config():
@@ -35,11 +110,83 @@ def get_anki_url() -> str:
     return get_config().ankiconnect.url
 
 
+def get_session() -> requests.Session:
+    """
+    Get or create the shared HTTP session used for AnkiConnect requests.
+
+    Reusing one session keeps the connection to Anki alive between calls
+    instead of paying a fresh TCP handshake for every request.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # AnkiConnect is a single local endpoint, so one small keep-alive pool is plenty
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=4,
+                    max_retries=Retry(total=2, backoff_factor=0.1),
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                # requests already sends keep-alive and "Accept-Encoding: gzip, deflate",
+                # so a compressing (e.g. remote) AnkiConnect can shrink large responses
+                session.headers.update({"Content-Type": "application/json"})
+                _session = session
+    return _session
+
+
+def close_session() -> None:
+    """Close the shared AnkiConnect session, releasing its pooled connection."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
 # Low Level
+def _post(payload: Dict[str, Any]) -> Any:
+    """
+    POST a payload to AnkiConnect and return the unwrapped result.
+
+    Raises:
+        Exception: If the response contains an error or connection fails
+    """
+    try:
+        response = get_session().post(
+            get_anki_url(),
+            data=orjson.dumps(payload),
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        # cardsInfo responses can be several MB; orjson parses the raw bytes directly
+        data = orjson.loads(response.content)
+
+        if data.get("error"):
+            raise Exception(f"AnkiConnect error: {data['error']}")
+
+        return data.get("result")
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        raise Exception(
+            f"Failed to connect to Anki: {str(e)}. Make sure Anki is running with AnkiConnect installed."
+        )
+
+
+def build_action(action: str, **params) -> Dict[str, Any]:
+    """Build a single AnkiConnect action payload, usable on its own or inside `multi`."""
+    return {"action": action, "version": 6, "params": params}
+
+
 def send_request(action: str, **params) -> Any:
     """
     Send a request to AnkiConnect API.
 
+    Read-only actions in _CACHEABLE_ACTIONS are cached for REQUEST_CACHE_TTL
+    seconds; actions in _MUTATING_ACTIONS clear the cache, since they may
+    have changed what a read returns. Other actions bypass the cache.
+
     Args:
         action: The action to perform
         **params: Additional parameters for the action
@@ -50,21 +197,68 @@ def send_request(action: str, **params) -> Any:
     Raises:
         Exception: If the response contains an error or connection fails
     """
-    payload = {"action": action, "version": 6, "params": params}
+    if action not in _CACHEABLE_ACTIONS:
+        if action in _MUTATING_ACTIONS:
+            clear_request_cache()
+        return _post(build_action(action, **params))
+
+    key = (action, orjson.dumps(params, option=orjson.OPT_SORT_KEYS))
+    now = time.monotonic()
+    with _request_cache_lock:
+        cached = _request_cache.get(key)
+    if cached is not None and now - cached[0] < REQUEST_CACHE_TTL:
+        return cached[1]
+
+    result = _post(build_action(action, **params))
+    with _request_cache_lock:
+        # Drop expired entries so the cache only ever holds the last few seconds
+        for stale_key in [k for k, (t, _) in _request_cache.items() if now - t >= REQUEST_CACHE_TTL]:
+            del _request_cache[stale_key]
+        _request_cache[key] = (now, result)
+    return result
+
+
+def clear_request_cache() -> None:
+    """Forget all cached AnkiConnect read results."""
+    with _request_cache_lock:
+        _request_cache.clear()
+
+
+def _send_multi_raw(actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Run several actions in a single AnkiConnect `multi` request.
 
-    try:
-        response = requests.post(get_anki_url(), json=payload)
-        response.raise_for_status()
-        data = response.json()
+    Returns:
+        One {"result": ..., "error": ...} dict per action, in order
+    """
+    if not actions:
+        return []
+    if any(action["action"] in _MUTATING_ACTIONS for action in actions):
+        clear_request_cache()
+    return _post(build_action("multi", actions=actions))
 
-        if data.get("error"):
-            raise Exception(f"AnkiConnect error: {data['error']}")
 
-        return data.get("result")
-    except requests.RequestException as e:
-        raise Exception(
-            f"Failed to connect to Anki: {str(e)}. Make sure Anki is running with AnkiConnect installed."
-        )
+def send_multi(actions: List[Dict[str, Any]]) -> List[Any]:
+    """
+    Send independent actions to AnkiConnect in one round-trip.
+
+    Args:
+        actions: Action payloads, typically built with `build_action`
+
+    Returns:
+        The result of each action, in the same order as `actions`
+
+    Raises:
+        Exception: If the request fails or any of the actions returned an error
+    """
+    results = []
+    for action, response in zip(actions, _send_multi_raw(actions)):
+        if response.get("error"):
+            raise Exception(
+                f"AnkiConnect error in '{action['action']}': {response['error']}"
+            )
+        results.append(response.get("result"))
+    return results
 
 
 def update_note(card_id: int, fields: dict) -> None:
@@ -81,6 +275,24 @@ def update_note(card_id: int, fields: dict) -> None:
     return response
 
 
+def iter_notes_info(note_ids: List[int]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield note information for many notes, fetching it in chunks.
+
+    notesInfo only carries note fields (no rendered question/answer HTML, CSS
+    or review schedule), and keeping each response to NOTES_INFO_CHUNK_SIZE
+    notes means a large deck is never held in memory as one JSON payload.
+
+    Args:
+        note_ids: The IDs of the notes to fetch
+
+    Returns:
+        An iterator over note information dictionaries, in the order of note_ids
+    """
+    for chunk in chunked(note_ids, NOTES_INFO_CHUNK_SIZE):
+        yield from send_request("notesInfo", notes=chunk)
+
+
 def _get_card_info(card_id: int) -> Dict[str, Any]:
     """
     Get detailed information about a specific card.
@@ -112,17 +324,18 @@ def get_kanji_card_info(card_id: int) -> KanjiCard:
         Dictionary with card information or None if the card couldn't be found
     """
 
+    # Only the card shown to the user is validated; bulk paths read raw dicts
     card_info = _get_card_info(card_id)
-    return KanjiCard(**card_info)
+    return KanjiCard.model_validate(card_info)
 
 
 # High Level
-def get_current_card() -> Optional[Dict[str, Any]]:
+def get_current_card() -> Optional[KanjiCard]:
     """
     Get information about the current card being reviewed.
 
     Returns:
-        Dictionary with card information or None if no card is being reviewed
+        The current Kanji card, or None if no card is being reviewed
     """
 
     result = send_request("guiCurrentCard")
@@ -134,9 +347,18 @@ def get_current_card() -> Optional[Dict[str, Any]]:
     if not card_info:
         return None
 
+    # Hand-edited fields can carry editor markup around the character
+    kanji_field = card_info.fields.Kanji
+    kanji_field.value = _clean_field_value(kanji_field.value)
     return card_info
 
 
+@lru_cache(maxsize=None)
+def _front_field_for(field_names: Tuple[str, ...]) -> Optional[str]:
+    """Return the first field name containing "front" (cards of one note type share a layout)."""
+    return next((f for f in field_names if "front" in f.lower()), None)
+
+
 def extract_kanji_from_cards(cards: List[Dict[str, Any]]) -> List[str]:
     """
     Extract kanji characters from a list of cards.
@@ -148,17 +370,18 @@ def extract_kanji_from_cards(cards: List[Dict[str, Any]]) -> List[str]:
         List of kanji characters
     """
     kanji_list = []
+    append = kanji_list.append  # bound once; this loop runs per card
 
     for card in cards:
         fields = card.get("fields", {})
         # Assuming the front field contains the kanji
-        front_field = next((f for f in fields.keys() if "front" in f.lower()), None)
+        front_field = _front_field_for(tuple(fields))
 
-        if front_field and fields[front_field].get("value"):
-            kanji = fields[front_field]["value"]
-            # Only take the first character if it's a kanji
-            if kanji and len(kanji) > 0 and is_kanji(kanji[0]):
-                kanji_list.append(kanji[0])
+        if front_field:
+            value = fields[front_field].get("value")
+            # Only take the first character if it's a kanji (CJK Unified Ideographs)
+            if value and "\u4e00" <= value[0] <= "\u9fff":
+                append(value[0])
 
     return kanji_list
 
@@ -213,16 +436,16 @@ def _update_furigana_classes(front_html: str, reviewed_kanji: Set[str]) -> Tuple
     Returns (updated_html, changed).
     """
     # Detect legacy Anki notation: kanji character followed by [reading]
-    if re.search(r'[\u4E00-\u9FFF]\[', front_html):
+    if _LEGACY_MARKER_RE.search(front_html):
         def migrate(m: re.Match) -> str:
             kanji = m.group(1)
             reading = m.group(2)
             rt_class = ' class="known"' if kanji in reviewed_kanji else ''
             return f'<ruby>{kanji}<rt{rt_class}>{reading}</rt></ruby>'
 
-        new_html = re.sub(r'([\u4E00-\u9FFF])\[([^\]]+)\]', migrate, front_html)
+        new_html = _LEGACY_FURIGANA_RE.sub(migrate, front_html)
         # Strip trailing spaces that the old format added after hiragana characters
-        new_html = re.sub(r'([\u3040-\u309F]) ', r'\1', new_html)
+        new_html = _KANA_TRAILING_SPACE_RE.sub(r"\1", new_html)
         return new_html, True  # always changed: format migration
 
     # New HTML format: update existing <rt> class attributes
@@ -248,17 +471,16 @@ def _update_furigana_classes(front_html: str, reviewed_kanji: Set[str]) -> Tuple
         else:
             return f'<ruby>{kanji}<rt>{reading}</rt></ruby>'
 
-    new_html = re.sub(
-        r'<ruby>([\u4E00-\u9FFF])<rt([^>]*)>(.*?)</rt></ruby>',
-        update_rt,
-        front_html,
-    )
+    new_html = _RUBY_RE.sub(update_rt, front_html)
     return new_html, changed
 
 
 def prepare_note(word: JishoWord, reviewed_kanji: Set[str]) -> Dict[str, Any]:
     """Create an Anki note from a word dictionary"""
 
+    if not word.definitions:
+        raise ValueError(f"No definitions found for '{word.expression}'")
+
     # Format the front with furigana HTML
     front = fetch_jisho_word_furigana(word.expression, reviewed_kanji)
 
@@ -274,7 +496,7 @@ def prepare_note(word: JishoWord, reviewed_kanji: Set[str]) -> Dict[str, Any]:
             FIELDS["expression"]: word.expression,
             FIELDS["kana_reading"]: word.kana,
             FIELDS["grammar"]: word.parts_of_speech[0] if word.parts_of_speech else "",
-            FIELDS["definition"]: word.definitions[0],
+            FIELDS["definition"]: back,
             FIELDS["additional_definitions"]: "\n".join(word.definitions[1:]),
             FIELDS["jlpt"]: f"JLPT N{word.jlpt}" if word.jlpt else "",
         },
@@ -290,8 +512,13 @@ def add_vocab_note_to_deck(
     Add selected words to the vocabulary Anki deck.
     Handles duplicate notes by skipping them and continuing with others.
 
+    Pass every word in one call: all notes are sent in a single `multi`
+    request, so calling this per word costs a round-trip each.
+
     Args:
         selected_words: List of word dictionaries containing word, reading, and definitions
+        deckname: Deck to add to (default: VOCAB_DECK_NAME)
+        reviewed_kanji: Reviewed Kanji whose furigana should be hidden
 
     Returns:
         None
@@ -299,27 +526,63 @@ def add_vocab_note_to_deck(
     if not selected_words:
         return
 
+    # Only needed when adding notes, so keep it off the import path of every command
+    from tqdm import tqdm
+
     deck = deckname if deckname is not None else VOCAB_DECK_NAME
     kanji_set = reviewed_kanji if reviewed_kanji is not None else set()
 
-    added_count = 0
-    duplicates_count = 0
+    # The same word can be selected twice; prepare and send it only once
+    unique_words = list({word.expression: word for word in selected_words}.values())
 
-    for word in tqdm(selected_words, desc="Adding notes", unit="note"):
+    added_count = 0
+    duplicates_count = len(selected_words) - len(unique_words)
+
+    # Furigana lookups hit Jisho per word, so prepare everything concurrently...
+    notes, note_words = [], []
+    with ThreadPoolExecutor(max_workers=PREPARE_NOTE_WORKERS) as pool:
+        futures = [pool.submit(prepare_note, word, kanji_set) for word in unique_words]
+
+        # Tick as lookups finish; small batches finish too fast to need a bar
+        for _ in tqdm(
+            as_completed(futures),
+            total=len(futures),
+            desc="Preparing notes",
+            unit="note",
+            leave=False,
+            disable=len(futures) < PROGRESS_BAR_MIN_NOTES,
+        ):
+            pass
+
+    for word, future in zip(unique_words, futures):
         try:
-            note = prepare_note(word, kanji_set) | {"deckName": deck}
+            # Each prepared note is a fresh dict, so set the deck on it in place
+            note = future.result()
+            note["deckName"] = deck
+            notes.append(note)
+            note_words.append(word)
         except Exception as e:
             print(f"Error preparing note for {word.expression}: {str(e)}")
-            continue
 
-        try:
-            send_request("addNote", note=note)
+    # ...then add them all to Anki in a single round-trip
+    try:
+        responses = _send_multi_raw([build_action("addNote", note=n) for n in notes])
+    except Exception as e:
+        print(f"Error adding notes: {str(e)}")
+        return
+
+    for word, response in zip(note_words, responses):
+        error = response.get("error")
+        if not error:
             added_count += 1
-        except Exception as e:
-            if "duplicate" in str(e).lower():
-                duplicates_count += 1
-            else:
-                print(f"Error adding note for {word.expression}: {str(e)}")
+        elif "duplicate" in str(error).lower():
+            duplicates_count += 1
+        else:
+            print(f"Error adding note for {word.expression}: {error}")
+
+    # The new words should show as already in the deck from now on
+    if added_count > 0:
+        invalidate_reviewed_vocab()
 
     if duplicates_count > 0 and added_count > 0:
         print(f"Added {added_count} notes. Skipped {duplicates_count} duplicate notes.")
@@ -331,76 +594,184 @@ def add_vocab_note_to_deck(
         print("No notes were added.")
 
 
-def get_reviewed_kanji() -> Set[str]:
+def _clean_field_value(value: str) -> str:
+    """Strip editor wrapper tags and surrounding whitespace from a field value in one pass."""
+    return _FIELD_WRAPPER_RE.sub("", value).strip()
+
+
+def set_cache_lookups_enabled(enabled: bool) -> None:
+    """Enable or disable reading the reviewed Kanji cache from disk."""
+    global _cache_lookups_enabled
+    _cache_lookups_enabled = enabled
+
+
+def _load_reviewed_kanji_cache() -> Dict[int, Tuple[str, int]]:
+    """Load the note ID -> (kanji, mod) map saved by a previous run, or {} if unavailable."""
+    if not _cache_lookups_enabled:
+        return {}
+    try:
+        data = orjson.loads((get_cache_dir() / REVIEWED_KANJI_CACHE_FILE).read_bytes())
+        return {
+            int(note_id): (entry["kanji"], int(entry["mod"]))
+            for note_id, entry in data.items()
+        }
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        return {}
+
+
+def _save_reviewed_kanji_cache(kanji_by_note: Dict[int, Tuple[str, int]]) -> None:
+    """Persist the note ID -> (kanji, mod) map; failures only cost a refetch next run."""
+    data = {
+        note_id: {"kanji": kanji, "mod": mod}
+        for note_id, (kanji, mod) in kanji_by_note.items()
+    }
+    try:
+        cache_dir = get_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / REVIEWED_KANJI_CACHE_FILE).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        )
+    except OSError as e:
+        print(f"Warning: Failed to save reviewed Kanji cache: {str(e)}")
+
+
+def _edited_since_days(mod: int) -> int:
     """
-    Get the set of Kanji that have been reviewed in the configured kanji deck.
+    Return the N for an `edited:N` search that covers every edit after `mod`.
 
-    Returns:
-        A set of reviewed Kanji characters
+    Anki counts days from the scheduler's day cutoff rather than from now, so
+    one extra day is added to avoid missing edits made just before a rollover.
+    """
+    elapsed = max(time.time() - mod, 0)
+    return math.ceil(elapsed / 86400) + 1
 
-    Raises:
-        Exception: If the operation fails
+
+@lru_cache(maxsize=1)
+def _reviewed_kanji_cached() -> FrozenSet[str]:
     """
-    reviewed_kanji = set()
+    Fetch the reviewed kanji from Anki once per process.
 
-    try:
-        # Get card IDs of reviewed cards in the Kanji deck
-        # TODO: Remove the flag bit from this later as this is really just for me!
-        kanji_deck = get_config().kanji_deck.name
-        card_ids = send_request(
-            "findCards", query=f'deck:"{kanji_deck}" (-is:new OR flag:1)'
+    Note IDs are always queried, but note info is only fetched for notes not in
+    the on-disk cache from a previous run or edited since the newest cached
+    modification time, so an unchanged deck costs two cheap findNotes calls.
+    Raises on failure so errors are never cached.
+    """
+    # Get note IDs of reviewed cards in the Kanji deck
+    # TODO: Remove the flag bit from this later as this is really just for me!
+    kanji_deck = get_config().kanji_deck.name
+    query = f'deck:"{kanji_deck}" (-is:new OR flag:1)'
+    note_ids = send_request("findNotes", query=query)
+
+    if not note_ids:
+        return frozenset()
+
+    cached = _load_reviewed_kanji_cache()
+    edited_ids: Set[int] = set()
+    if cached:
+        newest_mod = max(mod for _, mod in cached.values())
+        edited_ids = set(
+            send_request(
+                "findNotes", query=f"{query} edited:{_edited_since_days(newest_mod)}"
+            )
         )
+    kanji_by_note = {
+        n: cached[n] for n in note_ids if n in cached and n not in edited_ids
+    }
+    missing_ids = [n for n in note_ids if n not in kanji_by_note]
 
-        if not card_ids:
-            return reviewed_kanji
+    # Only the fields are needed, so fetch notes rather than full cards
+    notes_info = iter_notes_info(missing_ids)
+
+    # Extract Kanji from the Kanji field of each note (updated from Front to Kanji)
+    clean = _clean_field_value
+    fetched_at = int(time.time())
+    for note in notes_info:
+        kanji_field = note.get("fields", {}).get("Kanji")
+        if kanji_field is not None:
+            # Older AnkiConnect versions omit mod; the fetch time is a safe stand-in
+            kanji_by_note[note["noteId"]] = (
+                clean(kanji_field["value"]),
+                note.get("mod", fetched_at),
+            )
 
-        # Get card info for each card
-        cards_info = send_request("cardsInfo", cards=card_ids)
+    if kanji_by_note != cached:
+        _save_reviewed_kanji_cache(kanji_by_note)
 
-        # Extract Kanji from the Kanji field of each card (updated from Front to Kanji)
-        for card in cards_info:
-            if "fields" in card and "Kanji" in card["fields"]:
-                kanji = card["fields"]["Kanji"]["value"]
-                reviewed_kanji.add(kanji)
+    # Blank Kanji fields are cached too, so they aren't refetched, but aren't reviewed kanji
+    return frozenset(k for k, _ in kanji_by_note.values() if k)
 
-        return reviewed_kanji
+
+def invalidate_reviewed_kanji() -> None:
+    """Forget the in-process reviewed kanji so the next call re-reads Anki."""
+    _reviewed_kanji_cached.cache_clear()
+
+
+def get_reviewed_kanji() -> FrozenSet[str]:
+    """
+    Get the set of Kanji that have been reviewed in the configured kanji deck.
+
+    The result is computed once per process and shared by every caller; use
+    invalidate_reviewed_kanji() to pick up reviews made since.
+
+    Returns:
+        A frozen set of reviewed Kanji characters (empty if Anki can't be reached)
+    """
+    try:
+        return _reviewed_kanji_cached()
     except Exception as e:
         # If there's any error, just return an empty set rather than breaking the app flow
         print(f"Warning: Failed to get reviewed Kanji: {str(e)}")
-        return set()
+        return frozenset()
+
+
+@lru_cache(maxsize=1)
+def _reviewed_vocab_cached() -> FrozenSet[str]:
+    """
+    Fetch the words in the vocabulary deck once per process.
+
+    The deck only changes when this tool adds notes, and add_vocab_note_to_deck
+    invalidates the cache when it does. Raises on failure so errors are never cached.
+    """
+    # Find note IDs in the vocabulary deck
+    # Reviewed cards are those that are not new.
+    note_ids = send_request("findNotes", query=f"deck:{VOCAB_DECK_NAME}")
+
+    # Get note info for each note (one per word, however many card types it has)
+    notes_info = iter_notes_info(note_ids)
+
+    # Added the empty check to deal with my mess of old cards that don't match the current format!
+    expressions = (
+        _clean_field_value(i["fields"]["Expression"]["value"])
+        for i in notes_info
+        if "Expression" in i["fields"]
+    )
+    return frozenset(expression for expression in expressions if expression)
+
 
+def invalidate_reviewed_vocab() -> None:
+    """Forget the in-process reviewed vocab so the next call re-reads Anki."""
+    _reviewed_vocab_cached.cache_clear()
 
-def get_reviewed_vocab() -> List[str]:
+
+def get_reviewed_vocab() -> FrozenSet[str]:
     """
-    Get a list of reviewed words from the vocabulary deck.
+    Get the set of reviewed words from the vocabulary deck.
     Extracts the main word from the 'Front' field, typically from <ruby> tags.
 
+    The words are fetched once per process and refreshed after notes are added;
+    use invalidate_reviewed_vocab() to pick up changes made in Anki. A frozen
+    set is returned so callers can share it and check membership in O(1).
+
     Returns:
-        A list of reviewed words (main text from ruby tags or plain text).
+        A frozen set of reviewed words (empty if Anki can't be reached)
     """
-    reviewed_vocab: List[str] = []
     try:
-        # Find card IDs of reviewed cards in the vocabulary deck
-        # Reviewed cards are those that are not new.
-        card_ids = send_request("findCards", query=f"deck:{VOCAB_DECK_NAME}")
-
-        # Get card info for each card
-        cards_info = send_request("cardsInfo", cards=card_ids)
-
-        reviewed_vocab = [
-            i["fields"]["Expression"]["value"]
-            for i in cards_info
-            if "Expression" in i["fields"] and
-            # Added this in to deal with my mess of old cards that don't match the current format!
-            i["fields"]["Expression"]["value"].strip() != ""
-        ]
-
-        return reviewed_vocab
+        return _reviewed_vocab_cached()
     except Exception as e:
-        # If there's any error, print a warning and return an empty list
+        # If there's any error, print a warning and return an empty set
         # This behavior is consistent with get_reviewed_kanji
         print(f"Warning: Failed to get reviewed Vocab: {str(e)}")
-        return []
+        return frozenset()
 
 
 def sync_vocab_furigana() -> int:
@@ -414,38 +785,50 @@ def sync_vocab_furigana() -> int:
     Returns:
         Number of cards updated.
     """
+    # Kanji may have been reviewed in Anki during this session
+    invalidate_reviewed_kanji()
     reviewed_kanji = get_reviewed_kanji()
 
     try:
-        card_ids = send_request("findCards", query=f'deck:"{VOCAB_DECK_NAME}"')
+        note_ids = send_request("findNotes", query=f'deck:"{VOCAB_DECK_NAME}"')
     except Exception:
         return 0
 
-    if not card_ids:
+    if not note_ids:
         return 0
 
-    cards_info = send_request("cardsInfo", cards=card_ids)
-
-    # Deduplicate by note ID — multiple card types can share one note
-    seen_notes: Set[int] = set()
-    updated = 0
+    # Notes rather than cards, so multi-card notes are only visited once
+    pending_updates: List[Tuple[int, str]] = []
 
-    for card in cards_info:
-        note_id = card.get("note")
-        if note_id in seen_notes:
-            continue
-        seen_notes.add(note_id)
-
-        front = card.get("fields", {}).get("Front", {}).get("value", "")
+    for note in iter_notes_info(note_ids):
+        front = note.get("fields", {}).get("Front", {}).get("value", "")
         if not front:
             continue
 
         new_front, changed = _update_furigana_classes(front, reviewed_kanji)
         if changed:
-            try:
-                update_note(note_id, {"Front": new_front})
-                updated += 1
-            except Exception as e:
-                print(f"Warning: Failed to update note {note_id}: {e}")
+            pending_updates.append((note["noteId"], new_front))
+
+    if not pending_updates:
+        return 0
+
+    # Send every changed note back in one batch
+    try:
+        responses = _send_multi_raw(
+            [
+                build_action("updateNote", note={"id": note_id, "fields": {"Front": front}})
+                for note_id, front in pending_updates
+            ]
+        )
+    except Exception as e:
+        print(f"Warning: Failed to update notes: {e}")
+        return 0
+
+    updated = 0
+    for (note_id, _), response in zip(pending_updates, responses):
+        if response.get("error"):
+            print(f"Warning: Failed to update note {note_id}: {response['error']}")
+        else:
+            updated += 1
 
     return updated
@@ -1,11 +1,14 @@
 """ Schemas for Anki Cards and Decks"""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import TypeVar, List, Generic, Optional # Added Generic, TypeVar
 
 FieldType = TypeVar('FieldType', bound=BaseModel)
 
 class AnkiCard(BaseModel, Generic[FieldType]):
+    # populate_by_name lets code build cards with ord_val/type_val as well as the aliases.
+    model_config = ConfigDict(populate_by_name=True)
+
     # --- Standard Anki Fields ---
     cardId: int
     fields: FieldType
@@ -42,6 +45,8 @@ class KanjiFields(BaseModel):
     The fields of the Kanji card that are made available in the
     All In One Kanji Deck (https://ankiweb.net/shared/info/798002504)"""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     Kanji: KanjiFieldDetail
     Onyomi: KanjiFieldDetail
     Kunyomi: KanjiFieldDetail
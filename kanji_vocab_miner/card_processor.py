@@ -1,9 +1,15 @@
-from typing import List, Dict, Any, Set, Tuple
+import heapq
+from typing import List, Optional, Set, Tuple
 
 from kanji_vocab_miner.anki import connect
 from kanji_vocab_miner.jisho import JishoWord
 
-def sort_and_limit_words(words: List[JishoWord], original_kanji:str, limit: int = 10) -> List[Tuple[JishoWord, int]]:
+def sort_and_limit_words(
+    words: List[JishoWord],
+    original_kanji: str,
+    limit: int = 10,
+    reviewed_kanji: Optional[Set[str]] = None,
+) -> List[Tuple[JishoWord, int]]:
     """
     Sort words based on whether other Kanji in the word have been reviewed,
     and by JLPT level. Higher priority is given to words where all Kanji
@@ -12,6 +18,8 @@ def sort_and_limit_words(words: List[JishoWord], original_kanji:str, limit: int
     Args:
         words: List of word dictionaries from Jisho API
         limit: Maximum number of words to return (default: 10)
+        reviewed_kanji: Reviewed Kanji to rank against. Fetched from Anki
+            when not provided.
 
     Returns:
         Sorted list of words, limited to the specified count
@@ -22,27 +30,30 @@ def sort_and_limit_words(words: List[JishoWord], original_kanji:str, limit: int
         return []
 
     # Get the set of Kanji that have been reviewed
-    reviewed_kanji = connect.get_reviewed_kanji()
+    if reviewed_kanji is None:
+        reviewed_kanji = connect.get_reviewed_kanji()
 
-    # Remove the original Kanji from the list of words
-    words = [word for word in words if word.expression != original_kanji]
-
-    # Create a list of (word, priority, jlpt_rank) tuples for sorting
+    # Create a list of (priority, jlpt_rank, -position, word) tuples for sorting.
+    # The negated position keeps equal ranks in input order once reversed and
+    # means the words themselves are never compared.
     sortorder = []
-    for word in words:
+    for position, word in enumerate(words):
 
-        # Remove the original Kanji from the set of other Kanji
-        other_kanji = set(word.expression) - {original_kanji}
+        # Skip the original Kanji itself when it comes back as a word
+        if word.expression == original_kanji:
+            continue
 
         # Priority 1: All other Kanji are reviewed
         # Priority 0: Some other Kanji are not reviewed
-        all_reviewed = all(k in reviewed_kanji for k in other_kanji)
-        priority = 1 if all_reviewed else 0
+        # issuperset walks the string directly and stops at the first miss,
+        # so no per-word set is built
+        other_kanji = word.expression.replace(original_kanji, "")
+        priority = 1 if reviewed_kanji.issuperset(other_kanji) else 0
 
-        sortorder.append((priority, word.jlpt, word))
+        sortorder.append((priority, word.jlpt, -position, word))
 
-    sortorder = sorted(sortorder, reverse=True, key=lambda x: (x[0], x[1]))
+    # Only the top `limit` words are shown, so select them without sorting the rest
+    top = heapq.nlargest(limit, sortorder)
 
     # Return words using the sort order
-    sorted_words = [(word, priority) for priority, _, word in sortorder]
-    return sorted_words[:limit]
+    return [(word, priority) for priority, _, _, word in top]
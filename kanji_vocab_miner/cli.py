@@ -1,10 +1,10 @@
+import re
 import sys
 import unicodedata
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Set
 
 import click
-from prompt_toolkit import prompt as pt_prompt
-from prompt_toolkit.formatted_text import HTML
 
 from kanji_vocab_miner.anki import connect as ankiconnect
 
@@ -13,38 +13,68 @@ from kanji_vocab_miner.utils import parse_integer_selection, is_kanji, is_kotoba
 from kanji_vocab_miner.anki.schemas import KanjiCard
 from kanji_vocab_miner.jisho import JishoWord
 
-from jamdict import Jamdict
 from kanji_vocab_miner.render import console, info, success, error
 
 
-# Initialize Jamdict for word lookups
-jam = Jamdict()
+# Any digit in the input means it is a word selection like "1 3 5"
+_DIGIT_RE = re.compile(r"\d")
 
-def fetch_words_from_kanji(kanji: str) -> List[JishoWord]:
+# Jamdict for word lookups, opened on first use since most sessions never need it
+_jam = None
+
+# Prompt session for the main loop, kept so up-arrow recalls earlier input
+_prompt_session = None
+
+
+def get_jam():
+    """Get or open the Jamdict dictionary, in memory if configured to."""
+    global _jam
+    if _jam is None:
+        from jamdict import Jamdict
+
+        _jam = Jamdict(memory_mode=ankiconnect.get_config().jamdict.memory_mode)
+    return _jam
+
+
+def fetch_words_from_kanji(
+    kanji: str, reviewed_kanji: Optional[Set[str]] = None
+) -> List[JishoWord]:
     """
     Fetch words containing the kanji from Jisho and display them in a rich table.
 
     Args:
         kanji: The kanji character to search for
+        reviewed_kanji: Reviewed Kanji used for ranking, fetched once per session
 
     Returns:
         List of sorted words that were displayed to the user
     """
 
-    kanji_summary = jisho.fetch_kanji_summary(kanji)
+    # The summary page, word search and reviewed vocab are independent
+    # lookups against two services, so wait on them together behind one spinner
+    status = console.status(
+        f"Searching for words containing [yellow2]{kanji}[/yellow2]…", spinner="dots"
+    )
+    with status, ThreadPoolExecutor(max_workers=3) as pool:
+        summary_future = pool.submit(jisho.fetch_kanji_summary, kanji)
+        words_future = pool.submit(jisho.search_words_containing_kanji, kanji)
+        reviewed_vocab_future = pool.submit(ankiconnect.get_reviewed_vocab)
+
+        kanji_summary = summary_future.result()
+        words: List[JishoWord] = words_future.result()
+        if not words:
+            click.echo("No words found containing this Kanji.")
+            return []
 
-    words: List[JishoWord] = jisho.search_words_containing_kanji(kanji)
-    if not words:
-        click.echo("No words found containing this Kanji.")
-        return []
+        # Get the set of already reviewed words from Anki
+        reviewed_vocab = reviewed_vocab_future.result()
 
     if kanji_summary:
         render.kanji_summary(kanji_summary)
 
-    # Get list of already reviewed words from Anki
-    reviewed_vocab = ankiconnect.get_reviewed_vocab()
-
-    sorted_words = card_processor.sort_and_limit_words(words, kanji, 20)
+    sorted_words = card_processor.sort_and_limit_words(
+        words, kanji, 20, reviewed_kanji=reviewed_kanji
+    )
 
     render.words_table(sorted_words, reviewed_vocab)
 
@@ -54,19 +84,18 @@ def fetch_words_from_kanji(kanji: str) -> List[JishoWord]:
 def fetch_word_from_word(word: str) -> Optional[JishoWord]:
     """ Fetch a single word using jamdict"""
 
-    result = jam.lookup(word)
+    result = get_jam().lookup(word)
     entry = result.entries[0] if result.entries else None
 
     if entry:
-        # Parse jamdict entry to JishoWord
-        kanji = entry.kanji_forms[0].text
+        # Parse jamdict entry to JishoWord; kana-only words have no kanji form
         kana = entry.kana_forms[0].text
+        kanji = entry.kanji_forms[0].text if entry.kanji_forms else kana
         jplt = 0
 
-        senses = entry[:3]
-        glosses = ["; ".join([i.text for i in sense.gloss]) for sense in senses]
-        pos = [sense.pos[0] for sense in senses]
-
+        senses = entry.senses[:3]
+        glosses = ["; ".join(i.text for i in sense.gloss) for sense in senses]
+        pos = [sense.pos[0] if sense.pos else "" for sense in senses]
 
         jisho_word = JishoWord(
             expression=kanji,
@@ -105,9 +134,21 @@ def process_word_selection(
         selected_indices = parse_integer_selection(selection)
         newly_selected = []
 
+        # Words already pending or in the deck would only come back from Anki
+        # as duplicates; the deck's words are memoized from the table render
+        pending_expressions = {word.expression for word in pending_words}
+        in_deck = ankiconnect.get_reviewed_vocab()
+
         for idx in selected_indices:
             if 1 <= idx <= len(displayed_words):
                 word = displayed_words[idx - 1]
+                if word.expression in pending_expressions:
+                    info(f"{word.expression} is already pending.")
+                    continue
+                if word.expression in in_deck:
+                    info(f"{word.expression} is already in your deck.")
+                    continue
+                pending_expressions.add(word.expression)
                 pending_words.append(word)
                 newly_selected.append(word)
             else:
@@ -126,6 +167,36 @@ def process_word_selection(
     return pending_words
 
 
+def process_word_lookup(expression: str, pending_words: List[JishoWord]) -> List[JishoWord]:
+    """
+    Look up a single typed word and offer to add it to the pending list.
+
+    Args:
+        expression: The word the user typed
+        pending_words: Current list of pending words
+
+    Returns:
+        Updated list of pending words
+    """
+    with console.status(f"[bold]Looking up word {expression}…[/bold]", spinner="dots"):
+        word = fetch_word_from_word(expression)
+
+    if not word:
+        render.error(f"Word '{expression}' not found in JmDict.")
+    elif any(p.expression == word.expression for p in pending_words):
+        info(f"{word.expression} is already pending.")
+    elif word.expression in ankiconnect.get_reviewed_vocab():
+        info(f"{word.expression} is already in your deck.")
+    elif normalized_confirm(
+        f"Do you want to add {word.expression} ({word.kana}) to pending words?",
+        default=True,
+    ):
+        pending_words.append(word)
+        success(f"Added [bold]{word.expression}[/bold] to pending words.")
+
+    return pending_words
+
+
 def handle_next_card() -> Optional[str]:
     """Handle the 'n' command to fetch the next card from Anki."""
     with console.status("[bold]Fetching current Kanji from Anki…[/bold]", spinner="dots"):
@@ -144,8 +215,8 @@ def handle_next_card() -> Optional[str]:
     return kanji
 
 
-def add_pending_words_to_anki(pending_words: List[JishoWord], reviewed_kanji) -> None:
-    """Add pending words to Anki deck."""
+def add_pending_words_to_anki(pending_words: List[JishoWord], reviewed_kanji: Set[str]) -> None:
+    """Add pending words to Anki deck, handing the whole list over as one batch."""
     if not pending_words:
         info("No words to add.")
         return
@@ -158,6 +229,9 @@ def add_pending_words_to_anki(pending_words: List[JishoWord], reviewed_kanji) ->
 
 def normalized_input(prompt: str) -> str:
     """Read a line and normalize full-width ASCII to half-width."""
+    # prompt_toolkit is the slowest import in the CLI; only load it once input is needed
+    from prompt_toolkit import prompt as pt_prompt
+
     return unicodedata.normalize("NFKC", pt_prompt(prompt))
 
 
@@ -174,13 +248,25 @@ def normalized_confirm(prompt: str, default: bool = False) -> bool:
             return default
 
 
+def get_prompt_session():
+    """Get or create the prompt session for the main loop, so its history persists."""
+    global _prompt_session
+    if _prompt_session is None:
+        from prompt_toolkit import PromptSession
+
+        _prompt_session = PromptSession()
+    return _prompt_session
+
+
 def get_user_input(pending_count: int) -> str:
     """Get user input with a coloured prompt."""
+    from prompt_toolkit.formatted_text import HTML
+
     if pending_count:
         prompt_text = HTML(f"<ansiyellow>({pending_count} pending)</ansiyellow> <ansigreen><b>&gt; </b></ansigreen>")
     else:
         prompt_text = HTML("<ansigreen><b>&gt; </b></ansigreen>")
-    return unicodedata.normalize("NFKC", pt_prompt(prompt_text))
+    return unicodedata.normalize("NFKC", get_prompt_session().prompt(prompt_text))
 
 
 def prompt_and_reposition_kanji(kanji: str) -> bool:
@@ -220,12 +306,20 @@ def prompt_and_reposition_kanji(kanji: str) -> bool:
 
 
 @click.group(invoke_without_command=True)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Ignore cached Jisho responses and reviewed Kanji, and fetch fresh ones.",
+)
 @click.pass_context
-def jisho_anki(ctx):
+def jisho_anki(ctx, no_cache):
     """
     CLI tool to fetch Kanji cards from Anki, search for words on Jisho,
     and add selected words back to Anki.
     """
+    if no_cache:
+        jisho.set_cache_lookups_enabled(False)
+        ankiconnect.set_cache_lookups_enabled(False)
     # If no subcommand is provided, run the interactive mode
     if ctx.invoked_subcommand is None:
         run_interactive()
@@ -246,6 +340,8 @@ def _sync_furigana_and_exit() -> None:
         updated = ankiconnect.sync_vocab_furigana()
     if updated > 0:
         success(f"Updated furigana on {updated} vocab card(s).")
+    ankiconnect.close_session()
+    jisho.close_session()
     click.echo("Goodbye!")
     sys.exit(0)
 
@@ -260,12 +356,12 @@ def run_interactive():
     is_valid, errors = validate_prerequisites()
     if not is_valid:
         console.print("[bold red]Cannot start - missing prerequisites:[/bold red]\n")
-        for error in errors:
-            console.print(error)
+        for message in errors:
+            console.print(message)
             console.print()  # Empty line between errors
         sys.exit(1)
 
-    # Fetch reviewed kanji once at startup for use when adding new cards
+    # Fetch reviewed kanji once at startup for ranking words and adding new cards
     reviewed_kanji = ankiconnect.get_reviewed_kanji()
 
     displayed_words = []  # Store the last displayed word list
@@ -274,21 +370,35 @@ def run_interactive():
     while True:
         try:
             user_input = get_user_input(len(pending_words))
+            # Commands are matched case-insensitively; kanji and words use user_input as typed
+            command = user_input.strip().lower()
+
+            # A bare Enter just re-prompts, without running any of the checks below
+            if not command:
+                continue
 
             # Fetch new card and display words
-            if user_input.lower() == "n":
+            if command == "n":
                 kanji = handle_next_card()
                 if kanji:
-                    displayed_words = fetch_words_from_kanji(kanji)
+                    displayed_words = fetch_words_from_kanji(kanji, reviewed_kanji)
+
+            # You can also just enter a kanji directly; a single character is
+            # the cheapest input to recognise, so check it before the digit scan
+            elif is_kanji(user_input):
+                kanji = user_input
+                displayed_words = fetch_words_from_kanji(kanji, reviewed_kanji)
+
+                prompt_and_reposition_kanji(kanji)
 
             # Select words to add to pending list
-            elif any(c.isdigit() for c in user_input):
+            elif _DIGIT_RE.search(user_input):
                 pending_words = process_word_selection(
                     displayed_words, pending_words, user_input
                 )
 
             # Commit pending words to Anki
-            elif user_input.lower() == "c":
+            elif command == "c":
                 if not pending_words:
                     info("No words to commit.")
                     continue
@@ -297,7 +407,7 @@ def run_interactive():
                 pending_words.clear()  # I've known python for 5 years and have only just discovered this method!
 
             # Quit the program
-            elif user_input.lower() == "q":
+            elif command == "q":
                 if pending_words:
                     confirm_add = normalized_confirm(
                         f"You have {len(pending_words)} words pending. Add them to Anki",
@@ -307,31 +417,9 @@ def run_interactive():
                         add_pending_words_to_anki(pending_words, reviewed_kanji)
                 _sync_furigana_and_exit()
 
-            # You can also just enter a kanji directly
-            elif is_kanji(user_input):
-                kanji = user_input
-                with console.status(f"Searching for words containing [yellow2]{kanji}[/yellow2]…", spinner="dots"):
-                    displayed_words = fetch_words_from_kanji(kanji)
-
-                prompt_and_reposition_kanji(kanji)
-
             # Or look up a single word
             elif is_kotoba(user_input):
-                with console.status(f"[bold]Looking up word {user_input}…[/bold]", spinner="dots"):
-                    word = fetch_word_from_word(user_input)
-
-                if word:
-                    add_confirm = normalized_confirm(
-                        f"Do you want to add {word.expression} ({word.kana}) to pending words?",
-                        default=True,
-                    )
-                    if add_confirm:
-                        pending_words.append(word)
-                        success(f"Added [bold]{word.expression}[/bold] to pending words.")
-
-                else:
-                    render.error(f"Word '{user_input}' not found in JmDict.")
-
+                pending_words = process_word_lookup(user_input, pending_words)
 
             else:
                 click.echo("Invalid input. Enter 'n' (next), numbers to select, 'c' (commit), or 'q' (quit).")
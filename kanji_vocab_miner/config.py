@@ -1,7 +1,6 @@
 """Configuration management for kanji-vocab-miner."""
 
 from pathlib import Path
-from typing import Optional
 
 import tomllib
 from pydantic import BaseModel, Field
@@ -11,7 +10,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class AnkiConnectConfig(BaseModel):
     """Configuration for AnkiConnect connection."""
 
-    url: str = "http://localhost:8765"
+    # 127.0.0.1 rather than localhost: AnkiConnect binds IPv4 only, and resolving
+    # localhost can try ::1 first and stall before falling back (notably on Windows)
+    url: str = "http://127.0.0.1:8765"
 
 
 class KanjiDeckConfig(BaseModel):
@@ -20,6 +21,15 @@ class KanjiDeckConfig(BaseModel):
     name: str = "All in One Kanji"
 
 
+class JamdictConfig(BaseModel):
+    """Configuration for the local Jamdict dictionary."""
+
+    # Copies the dictionary database into RAM (a few hundred MB) so word
+    # lookups skip SQLite disk reads; needs a recent puchikarui, and Jamdict
+    # falls back to the file database on its own when that is missing
+    memory_mode: bool = False
+
+
 class AppConfig(BaseSettings):
     """Application configuration with environment variable support."""
 
@@ -29,6 +39,7 @@ class AppConfig(BaseSettings):
 
     ankiconnect: AnkiConnectConfig = Field(default_factory=AnkiConnectConfig)
     kanji_deck: KanjiDeckConfig = Field(default_factory=KanjiDeckConfig)
+    jamdict: JamdictConfig = Field(default_factory=JamdictConfig)
 
 
 # Hardcoded vocabulary deck settings (created via setup command)
@@ -69,6 +80,15 @@ def get_config_path() -> Path:
     return xdg_config  # Default location for new configs
 
 
+def get_cache_dir() -> Path:
+    """Return the directory for locally cached Anki/Jisho data.
+
+    Lives at ~/.cache/kanji-vocab-miner alongside the XDG config location.
+    The directory is not created here; writers create it on first use.
+    """
+    return Path.home() / ".cache" / "kanji-vocab-miner"
+
+
 def load_config() -> AppConfig:
     """Load configuration from file or use defaults.
 
@@ -1,16 +1,60 @@
 # %%
 # Imports
+import hashlib
 import requests
+import threading
+import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
-from bs4 import BeautifulSoup
+import orjson
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from kanji_vocab_miner.config import get_cache_dir
+from kanji_vocab_miner.utils import is_hiragana, is_kanji
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 KANJI_DETAIL_SUFFIX = "%23kanji"
 KANJI_BASE_URL = "https://jisho.org/search/"
 KANJI_DETAIL_SELECTOR = "div.kanji.details"
 
+# Only the subtrees we read are built into soup objects; the rest of the page
+# is tokenized and dropped, which roughly halves parse time on Jisho pages
+WORD_REPRESENTATION_CLASS = "concept_light-representation"
+KANJI_DETAIL_CLASS = "details"
+
+# Jisho tags JLPT levels with one of these fixed strings
+_JLPT_TAG_LEVELS = {f"jlpt-n{level}": level for level in range(1, 6)}
+
+# (connect, read) timeouts in seconds for jisho.org requests
+REQUEST_TIMEOUT = (5, 30)
+
+# Notes are prepared on up to this many threads, each scraping a word page
+SESSION_POOL_SIZE = 8
+
+_session = None
+# Worker threads share the session, so it is created under a lock
+_session_lock = threading.Lock()
+
+# Word searches and word pages barely change day to day, so keep them on disk
+# for a day; each kind of response gets its own subdirectory
+SEARCH_CACHE_SUBDIR = "jisho-search"
+FURIGANA_CACHE_SUBDIR = "jisho-furigana"
+CACHE_TTL = 24 * 60 * 60
+
+# Cleared by --no-cache; fresh responses are still written back to disk
+_cache_lookups_enabled = True
+
+# Cache directories already swept for expired responses in this process
+_pruned_cache_dirs: Set[Path] = set()
+_prune_lock = threading.Lock()
+
 
 # Classes
 class JishoWord(BaseModel):
@@ -29,10 +73,125 @@ class KanjiSummary(BaseModel):
     jlpt: int
 
 
+def get_session() -> requests.Session:
+    """
+    Get or create the shared HTTP session used for jisho.org requests.
+
+    Reusing one session keeps TLS connections to jisho.org alive, so only the
+    first request of a run pays for the TCP and TLS handshakes.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Lookups are plain GETs, so transient drops and overload responses from
+                # jisho.org are safe to retry instead of failing a word outright
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=SESSION_POOL_SIZE,
+                    max_retries=Retry(
+                        total=2, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504)
+                    ),
+                )
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def close_session() -> None:
+    """Close the shared Jisho session, releasing its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def set_cache_lookups_enabled(enabled: bool) -> None:
+    """Enable or disable reading cached Jisho responses from disk."""
+    global _cache_lookups_enabled
+    _cache_lookups_enabled = enabled
+
+
+def _cache_path(subdir: str, key: str) -> Path:
+    """Return the cache file for a key, named by a hash of the key."""
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return get_cache_dir() / subdir / f"{digest}.json"
+
+
+def _load_cached(subdir: str, key: str) -> Optional[Any]:
+    """Return a cached response younger than CACHE_TTL, or None."""
+    if not _cache_lookups_enabled:
+        return None
+    path = _cache_path(subdir, key)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_TTL:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _prune_cache_dir(directory: Path) -> None:
+    """Remove expired responses from a cache directory, once per process."""
+    with _prune_lock:
+        if directory in _pruned_cache_dirs:
+            return
+        _pruned_cache_dirs.add(directory)
+    cutoff = time.time() - CACHE_TTL
+    try:
+        stale_files = list(directory.glob("*.json"))
+    except OSError:
+        return
+    for stale in stale_files:
+        # Another thread or process may remove the same file first
+        try:
+            if stale.stat().st_mtime < cutoff:
+                stale.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"Warning: Failed to prune Jisho cache: {str(e)}")
+
+
+def _save_cached(subdir: str, key: str, content: bytes) -> None:
+    """
+    Persist a raw response; failures only cost a refetch next time.
+
+    The first save into a directory also sweeps out expired responses, so the
+    cache holds at most one day's lookups instead of growing with every word
+    ever looked up.
+    """
+    path = _cache_path(subdir, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    except OSError as e:
+        print(f"Warning: Failed to save Jisho cache: {str(e)}")
+        return
+    _prune_cache_dir(path.parent)
+
+
+def _parse_divs_with_class(html: str, class_name: str) -> "BeautifulSoup":
+    """Parse only the divs of a page that carry class_name, and their contents."""
+    # bs4 is only needed once a page has been fetched; keep it off the startup path
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # While straining, class is the raw attribute string, so match on its words
+    strainer = SoupStrainer(
+        "div", class_=lambda value: value is not None and class_name in value.split()
+    )
+    return BeautifulSoup(html, "html.parser", parse_only=strainer)
+
+
 def fetch_jisho_word_search(query: str) -> Dict[str, Any]:
     """
     Fetch raw data from the Jisho API for the given query.
 
+    Responses are kept on disk for CACHE_TTL, so repeat searches for the
+    same kanji skip the network.
+
     Args:
         query: The search query to send to Jisho API
 
@@ -42,16 +201,23 @@ def fetch_jisho_word_search(query: str) -> Dict[str, Any]:
     Raises:
         Exception: If the request fails or the response is invalid
     """
+    cached = _load_cached(SEARCH_CACHE_SUBDIR, query)
+    if cached is not None:
+        return cached
+
     try:
         # Construct the URL with proper encoding
         encoded_query = urllib.parse.quote(query)
         url = f"https://jisho.org/api/v1/search/words?keyword=*{encoded_query}*"
 
         # Send the request
-        response = requests.get(url)
+        response = get_session().get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()  # Raise exception for HTTP errors
 
-        return response.json()
+        # Search results run to dozens of entries, so decode them with orjson
+        data = orjson.loads(response.content)
+        _save_cached(SEARCH_CACHE_SUBDIR, query, response.content)
+        return data
 
     except requests.RequestException as e:
         raise Exception(f"Failed to connect to Jisho API: {str(e)}")
@@ -59,22 +225,51 @@ def fetch_jisho_word_search(query: str) -> Dict[str, Any]:
         raise Exception(f"Error processing Jisho API response: {str(e)}")
 
 
-def fetch_jisho_word_furigana(word: str, reviewed_kanji: Set[str]) -> str:
+@lru_cache(maxsize=4096)
+def _fetch_furigana_parts(word: str) -> Tuple[str, Tuple[str, ...]]:
     """
-    Fetch the furigana mapping for a given word by scraping the Jisho web page.
+    Scrape the Jisho word page for a word's characters and per-kanji furigana.
 
-    Returns HTML ruby markup with <rt class="known"> for kanji in reviewed_kanji.
+    Cached in memory and on disk because the readings don't depend on which
+    kanji have been reviewed, so repeated lookups of the same word skip the
+    HTTP round-trip, across runs as well.
+
+    Returns:
+        A tuple of (characters, furigana) where furigana has one entry per
+        furigana span on the page
     """
+    cached = _load_cached(FURIGANA_CACHE_SUBDIR, word)
+    if cached is not None:
+        return cached["characters"], tuple(cached["furigana"])
 
-    response = requests.get("https://jisho.org/word/" + word)
-    soup = BeautifulSoup(response.text, "html.parser")
+    response = get_session().get("https://jisho.org/word/" + word, timeout=REQUEST_TIMEOUT)
+    soup = _parse_divs_with_class(response.text, WORD_REPRESENTATION_CLASS)
 
-    wordhtml = soup.select("div.concept_light-representation")[0].extract()
+    wordhtml = soup.select("div.concept_light-representation")[0]
 
     characters = wordhtml.select_one("span.text").text.strip(" \n")
-    furigana = [i.text for i in wordhtml.select("span.kanji")]
+    furigana = tuple(i.text for i in wordhtml.select("span.kanji"))
+
+    _save_cached(
+        FURIGANA_CACHE_SUBDIR,
+        word,
+        orjson.dumps({"characters": characters, "furigana": furigana}),
+    )
+    return characters, furigana
+
+
+def fetch_jisho_word_furigana(word: str, reviewed_kanji: Set[str]) -> str:
+    """
+    Fetch the furigana mapping for a given word by scraping the Jisho web page.
+
+    Returns HTML ruby markup with <rt class="known"> for kanji in reviewed_kanji.
+    """
+
+    characters, furigana = _fetch_furigana_parts(word)
 
-    kanji_chars = [c for c in characters if is_kanji(c)]
+    # Classify each character once; the matching loop below reuses the flags
+    kanji_flags = [is_kanji(c) for c in characters]
+    kanji_chars = [c for c, kanji in zip(characters, kanji_flags) if kanji]
 
     # Fallback: apply full furigana to the whole word as one ruby
     if len(furigana) != len(kanji_chars):
@@ -82,18 +277,18 @@ def fetch_jisho_word_furigana(word: str, reviewed_kanji: Set[str]) -> str:
         return f'<ruby>{characters}<rt{rt_class}>{"".join(furigana)}</rt></ruby>'
 
     # Match each kanji with its furigana; pass hiragana through as-is
-    result, furigana_idx = "", 0
-    for c in characters:
-        if is_kanji(c):
+    parts, furigana_idx = [], 0
+    for c, kanji in zip(characters, kanji_flags):
+        if kanji:
             rt_class = ' class="known"' if c in reviewed_kanji else ''
-            result += f'<ruby>{c}<rt{rt_class}>{furigana[furigana_idx]}</rt></ruby>'
+            parts.append(f'<ruby>{c}<rt{rt_class}>{furigana[furigana_idx]}</rt></ruby>')
             furigana_idx += 1
         elif is_hiragana(c):
-            result += c
+            parts.append(c)
         else:
             raise Exception(f"Unknown character type: {c}")
 
-    return result
+    return "".join(parts)
 
 
 def fetch_kanji_summary(kanji: str) -> Optional[KanjiSummary]:
@@ -108,7 +303,7 @@ def fetch_kanji_summary(kanji: str) -> Optional[KanjiSummary]:
     url = f"{KANJI_BASE_URL}{encoded_kanji}{KANJI_DETAIL_SUFFIX}"
 
     try:
-        response = requests.get(url)
+        response = get_session().get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
     except requests.RequestException as exc:
         raise Exception(
@@ -119,7 +314,7 @@ def fetch_kanji_summary(kanji: str) -> Optional[KanjiSummary]:
 
 
 def _parse_kanji_summary_from_html(kanji: str, html: str) -> Optional[KanjiSummary]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _parse_divs_with_class(html, KANJI_DETAIL_CLASS)
     details = soup.select_one(KANJI_DETAIL_SELECTOR)
     if not details:
         return None
@@ -145,7 +340,7 @@ def _parse_kanji_summary_from_html(kanji: str, html: str) -> Optional[KanjiSumma
     )
 
 
-def _extract_readings(details_node: BeautifulSoup, class_name: str) -> List[str]:
+def _extract_readings(details_node: "BeautifulSoup", class_name: str) -> List[str]:
     selector = f"dl.dictionary_entry.{class_name} dd"
     node = details_node.select_one(selector)
     if not node:
@@ -214,37 +409,26 @@ def search_words_containing_kanji(kanji: str) -> List[JishoWord]:
         if "japanese" not in item or not item["japanese"]:
             continue
 
-        # Extract word and reading
+        # Extract the word; the reading stands in for kana-only entries
         japanese_data = item["japanese"][0]
-        word = japanese_data.get("word", japanese_data.get("reading", ""))
         reading = japanese_data.get("reading", "")
+        word = japanese_data.get("word", reading)
 
         # Skip if the target Kanji isn't in the word
         if kanji not in word:
             continue
 
-        # Extract JLPT level
-        jlpt_data = item.get("jlpt", [])
-        jlpt_level = 0
-        if jlpt_data:
-            # Extract the numeric level from strings like "jlpt-n5"
-            for level in jlpt_data:
-                if level.startswith("jlpt-n"):
-                    try:
-                        jlpt_level = int(level.split("jlpt-n")[1])
-                        break
-                    except (ValueError, IndexError):
-                        pass
+        # Extract JLPT level from the first tag like "jlpt-n5"
+        jlpt_level = next(
+            (_JLPT_TAG_LEVELS[tag] for tag in item.get("jlpt", ()) if tag in _JLPT_TAG_LEVELS),
+            0,
+        )
 
         # Extract definitions and parts of speech (up to 3)
         definitions, parts_of_speech = [], []
-        if "senses" in item:
-            for sense in item["senses"][:3]:  # Limit to top 3 senses
-                definition = "; ".join(sense.get("english_definitions", []))
-                pos = "; ".join(sense.get("parts_of_speech", []))
-
-                definitions.append(definition)
-                parts_of_speech.append(pos)
+        for sense in item.get("senses", ())[:3]:  # Limit to top 3 senses
+            definitions.append("; ".join(sense.get("english_definitions", ())))
+            parts_of_speech.append("; ".join(sense.get("parts_of_speech", ())))
 
         # Results
         jishoword = JishoWord(
@@ -258,28 +442,3 @@ def search_words_containing_kanji(kanji: str) -> List[JishoWord]:
         result_words.append(jishoword)
 
     return result_words
-
-
-def is_kanji(char: str) -> bool:
-    """
-    Check if a character is a Kanji.
-    """
-
-    if len(char) != 1:
-        return False
-
-    # Unicode ranges for Kanji: CJK Unified Ideographs (4E00-9FFF)
-    return 0x4E00 <= ord(char) <= 0x9FFF
-
-
-def is_hiragana(char: str) -> bool:
-    """
-    Check if a character is Hiragana.
-    """
-    if len(char) != 1:
-        return False
-
-    # Unicode range for Hiragana: U+3040 to U+309F
-    return 0x3040 <= ord(char) <= 0x309F
-
-# %%
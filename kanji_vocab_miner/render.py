@@ -1,6 +1,6 @@
 """Rendering functions for displaying on CLI"""
 
-from typing import List, Tuple
+from typing import FrozenSet, List, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
@@ -8,11 +8,8 @@ from rich.table import Table
 from rich.text import Text
 from rich.rule import Rule
 
-from kanji_vocab_miner.anki import connect
 from kanji_vocab_miner.jisho import JishoWord, KanjiSummary
 
-from jamdict.jmdict import JMDEntry
-
 console = Console()
 
 
@@ -59,11 +56,29 @@ def kanji_summary(summary: KanjiSummary) -> None:
 
 
 
-def words_table(
-    sorted_words: List[Tuple[JishoWord, bool]], reviewed_vocab: List[str]
-) -> None:
-    """Render a table of words with details"""
+# Colour for each JLPT level shown in the words table (0 means no level)
+JLPT_COLORS = {
+    5: "#209c05",
+    4: "#85e62c",
+    3: "#ebff0a",
+    2: "#f2ce02",
+    1: "#ff0a0a",
+    0: "#c3c4c7",
+}
 
+
+# The priority, in-deck and JLPT cells only take a handful of values, so build
+# each Text once and reuse it for every row
+_PRIORITY_TEXT = Text("R", style="#00c18b")
+_IN_DECK_TEXT = Text("Y", style="#00c18b")
+_JLPT_TEXT = {
+    level: Text(f"N{level}", style=color) if level else Text("")
+    for level, color in JLPT_COLORS.items()
+}
+
+
+def _new_words_table() -> Table:
+    """Create an empty words table; Rich tables hold their rows, so one is built per render."""
     table = Table(box=None, show_header=False)
 
     table.add_column("Index", style="yellow2")
@@ -73,40 +88,37 @@ def words_table(
     table.add_column("Priority", style="magenta")
     table.add_column("Already in Deck", style="light_slate_grey")
     table.add_column("Definition", style="grey74")
+    return table
 
-    jlpt_colors = {
-        5: "#209c05",
-        4: "#85e62c",
-        3: "#ebff0a",
-        2: "#f2ce02",
-        1: "#ff0a0a",
-        0: "#c3c4c7",
-    }
+
+def words_table(
+    sorted_words: List[Tuple[JishoWord, bool]], reviewed_vocab: FrozenSet[str]
+) -> None:
+    """Render a table of words with details"""
+
+    table = _new_words_table()
 
     for idx, (word, priority) in enumerate(sorted_words, 1):
+        # Read each field once; Jisho can return a hit with no English senses
+        expression, jlpt, definitions = word.expression, word.jlpt, word.definitions
+
         # JLPT
-        jlpt_text = (
-            Text(f"N{word.jlpt}", style=jlpt_colors.get(word.jlpt, "#c3c4c7"))
-            if word.jlpt
-            else Text("")
-        )
+        jlpt_text = _JLPT_TEXT.get(jlpt)
+        if jlpt_text is None:
+            jlpt_text = Text(f"N{jlpt}", style="#c3c4c7")
         # Priority
-        priority_text = Text("R", style="#00c18b") if priority else ""
+        priority_text = _PRIORITY_TEXT if priority else ""
         # Already in deck?
-        in_deck = (
-            Text("Y", style="#00c18b")
-            if word.expression in reviewed_vocab
-            else ""
-        )
+        in_deck = _IN_DECK_TEXT if expression in reviewed_vocab else ""
 
         table.add_row(
             f"{idx}.",
-            word.expression,
+            expression,
             word.kana,
             jlpt_text,
             priority_text,
             in_deck,
-            word.definitions[0],
+            definitions[0] if definitions else "",
         )
     # Add a separator line
     console.print(Rule(style="dim"))
@@ -23,10 +23,17 @@ def validate_prerequisites() -> Tuple[bool, List[str]]:
     config = load_config()
     kanji_deck_name = config.kanji_deck.name
 
-    # 1. Check AnkiConnect connectivity
+    # 1. Check AnkiConnect connectivity, fetching deck and note type names in
+    # the same round-trip since those lookups can't fail on their own
     try:
-        connect.send_request("version")
-    except Exception as e:
+        _, deck_names, model_names = connect.send_multi(
+            [
+                connect.build_action("version"),
+                connect.build_action("deckNames"),
+                connect.build_action("modelNames"),
+            ]
+        )
+    except Exception:
         errors.append(
             "[red]✗ Cannot connect to AnkiConnect[/red]\n"
             "  Please ensure:\n"
@@ -37,39 +44,27 @@ def validate_prerequisites() -> Tuple[bool, List[str]]:
         return False, errors  # Can't check anything else without connectivity
 
     # 2. Check vocabulary deck exists
-    try:
-        deck_names = connect.send_request("deckNames")
-        if VOCAB_DECK_NAME not in deck_names:
-            errors.append(
-                f"[red]✗ Vocabulary deck '{VOCAB_DECK_NAME}' not found[/red]\n"
-                f"  Run: [bold cyan]kanji-vocab-miner setup[/bold cyan] to create it"
-            )
-    except Exception:
-        errors.append("[red]✗ Failed to check for vocabulary deck[/red]")
+    if VOCAB_DECK_NAME not in deck_names:
+        errors.append(
+            f"[red]✗ Vocabulary deck '{VOCAB_DECK_NAME}' not found[/red]\n"
+            f"  Run: [bold cyan]kanji-vocab-miner setup[/bold cyan] to create it"
+        )
 
     # 3. Check note type exists
-    try:
-        model_names = connect.send_request("modelNames")
-        if VOCAB_NOTE_TYPE not in model_names:
-            errors.append(
-                f"[red]✗ Note type '{VOCAB_NOTE_TYPE}' not found[/red]\n"
-                f"  Run: [bold cyan]kanji-vocab-miner setup[/bold cyan] to create it"
-            )
-    except Exception:
-        errors.append("[red]✗ Failed to check for note type[/red]")
+    if VOCAB_NOTE_TYPE not in model_names:
+        errors.append(
+            f"[red]✗ Note type '{VOCAB_NOTE_TYPE}' not found[/red]\n"
+            f"  Run: [bold cyan]kanji-vocab-miner setup[/bold cyan] to create it"
+        )
 
     # 4. Check "All In One Kanji" deck exists
-    try:
-        deck_names = connect.send_request("deckNames")
-        if kanji_deck_name not in deck_names:
-            errors.append(
-                f"[red]✗ Kanji deck '{kanji_deck_name}' not found[/red]\n"
-                f"  This deck is required for the tool to work.\n"
-                f"  Download from: https://ankiweb.net/shared/info/1862058740\n"
-                f"  Or configure a different kanji deck in: ~/.config/kanji-vocab-miner/config.toml"
-            )
-    except Exception:
-        errors.append("[red]✗ Failed to check for kanji deck[/red]")
+    if kanji_deck_name not in deck_names:
+        errors.append(
+            f"[red]✗ Kanji deck '{kanji_deck_name}' not found[/red]\n"
+            f"  This deck is required for the tool to work.\n"
+            f"  Download from: https://ankiweb.net/shared/info/1862058740\n"
+            f"  Or configure a different kanji deck in: ~/.config/kanji-vocab-miner/config.toml"
+        )
 
     return len(errors) == 0, errors
 
@@ -98,7 +93,7 @@ def run_setup():
             "\n[yellow]Please ensure:[/yellow]\n"
             "  1. Anki is running\n"
             "  2. AnkiConnect plugin is installed\n"
-            "  3. AnkiConnect is listening on http://localhost:8765"
+            "  3. AnkiConnect is listening on http://127.0.0.1:8765"
         )
         return False
 
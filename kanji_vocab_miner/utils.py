@@ -1,4 +1,10 @@
-from typing import List
+import re
+from typing import Iterator, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Two or more Kanji (4E00–9FFF), Hiragana (3040–309F) or Katakana (30A0–30FF)
+_KOTOBA_RE = re.compile(r"[\u4E00-\u9FFF\u3040-\u309F\u30A0-\u30FF]{2,}")
 
 
 def parse_integer_selection(input_str: str) -> List[int]:
@@ -33,6 +39,20 @@ def parse_integer_selection(input_str: str) -> List[int]:
         # Return an empty list if any unexpected error occurs
         return []
 
+def chunked(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """
+    Split a sequence into consecutive slices of at most `size` items.
+
+    Args:
+        items: The sequence to split
+        size: Maximum length of each slice
+
+    Returns:
+        An iterator over the slices, in order
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 def is_kanji(char: str) -> bool:
     """
     Check if a character is a Kanji.
@@ -50,21 +70,24 @@ def is_kanji(char: str) -> bool:
     code_point = ord(char)
     return 0x4E00 <= code_point <= 0x9FFF
 
-def is_kotoba(s: str) -> bool:
+def is_hiragana(char: str) -> bool:
     """
-    Check if a string is a Japanese word composed of Kanji, Hiragana, or Katakana.:
+    Check if a character is Hiragana.
+
+    Args:
+        char: The character to check
+
+    Returns:
+        True if the character is Hiragana, False otherwise
     """
-    if len(s) < 2:
+    # Unicode range for Hiragana: U+3040 to U+309F
+    if len(char) != 1:
         return False
 
-    for c in s:
-        cp = ord(c)
-        # Kanji (4E00–9FFF), Hiragana (3040–309F), Katakana (30A0–30FF)
-        if not (
-            0x4E00 <= cp <= 0x9FFF
-            or 0x3040 <= cp <= 0x309F
-            or 0x30A0 <= cp <= 0x30FF
-        ):
-            return False
-
-    return True
\ No newline at end of file
+    return 0x3040 <= ord(char) <= 0x309F
+
+def is_kotoba(s: str) -> bool:
+    """
+    Check if a string is a Japanese word composed of Kanji, Hiragana, or Katakana.:
+    """
+    return _KOTOBA_RE.fullmatch(s) is not None
@@ -20,13 +20,17 @@ import sys
 import urllib.parse
 from typing import Optional, Tuple
 
-import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
-from kanji_vocab_miner.anki.connect import send_request, update_note, sync_vocab_furigana
+from kanji_vocab_miner.anki.connect import (
+    iter_notes_info,
+    send_request,
+    sync_vocab_furigana,
+    update_note,
+)
 from kanji_vocab_miner.config import VOCAB_DECK_NAME, FIELDS
-from kanji_vocab_miner.jisho import fetch_jisho_word_furigana, JishoWord
+from kanji_vocab_miner.jisho import fetch_jisho_word_furigana, get_session, JishoWord
 
 # ---------------------------------------------------------------------------
 # Pattern detection
@@ -75,7 +79,7 @@ def lookup_jisho_word(expression: str) -> Optional[JishoWord]:
 
     for url in urls:
         try:
-            resp = requests.get(url, timeout=10)
+            resp = get_session().get(url, timeout=10)
             resp.raise_for_status()
             data = resp.json().get("data", [])
         except Exception:
@@ -161,31 +165,26 @@ def main() -> None:
     if dry_run:
         print("=== DRY RUN — no changes will be written ===\n")
 
-    # Fetch all cards from the vocab deck
-    print(f"Fetching cards from: {VOCAB_DECK_NAME}")
+    # Fetch all notes from the vocab deck; only the Front field is inspected,
+    # so notes (one per word) are fetched rather than every card
+    print(f"Fetching notes from: {VOCAB_DECK_NAME}")
     try:
-        card_ids = send_request("findCards", query=f'deck:"{VOCAB_DECK_NAME}"')
+        note_ids = send_request("findNotes", query=f'deck:"{VOCAB_DECK_NAME}"')
     except Exception as e:
         print(f"Error connecting to Anki: {e}")
         sys.exit(1)
 
-    if not card_ids:
-        print("No cards found.")
+    if not note_ids:
+        print("No notes found.")
         return
 
-    print(f"Found {len(card_ids)} cards. Fetching card info...")
-    cards_info = send_request("cardsInfo", cards=card_ids)
+    print(f"Found {len(note_ids)} notes. Fetching note info...")
 
-    # First pass: identify legacy cards (fast, no network calls)
-    seen_notes: set = set()
+    # First pass: identify legacy cards (fast, no Jisho lookups)
     legacy: list = []
-    for card in cards_info:
-        note_id = card.get("note")
-        if note_id in seen_notes:
-            continue
-        seen_notes.add(note_id)
-
-        front = card.get("fields", {}).get("Front", {}).get("value", "")
+    for note in iter_notes_info(note_ids):
+        note_id = note.get("noteId")
+        front = note.get("fields", {}).get("Front", {}).get("value", "")
 
         p1 = detect_plain_text(front)
         if p1:
@@ -196,7 +195,7 @@ def main() -> None:
         if p2:
             legacy.append((note_id, p2, "Jisho HTML"))
 
-    total_notes = len(seen_notes)
+    total_notes = len(note_ids)
     print(f"Scanned {total_notes} unique notes — {len(legacy)} legacy card(s) found.\n")
 
     if not legacy:
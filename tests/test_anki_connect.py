@@ -1,10 +1,12 @@
 import pytest
 import requests
+from unittest.mock import MagicMock, patch
 
 from kanji_vocab_miner.anki import connect
-from kanji_vocab_miner.anki.schemas import KanjiCard
+from kanji_vocab_miner.anki.schemas import KanjiCard, KanjiFields
 from kanji_vocab_miner.jisho import JishoWord # Added import
 
+@pytest.mark.anki_live
 def test_ping_anki():
     """
     Test if Anki is running and AnkiConnect is available.
@@ -18,7 +20,9 @@ def test_ping_anki():
             "action": "version",
             "version": 6
         }
-        response = requests.post("http://localhost:8765", json=payload)
+        # Ping through the package's pooled session, so the live tests that
+        # follow reuse this connection to the configured AnkiConnect URL
+        response = connect.get_session().post(connect.get_anki_url(), json=payload)
         response.raise_for_status()
 
         # Check if we got a valid response
@@ -67,6 +71,7 @@ def test_get_current_kanji():
     assert 0x4E00 <= ord(kanjichar) <= 0x9FFF
 
 
+@pytest.mark.anki_live
 def test_get_reviewed_kanji():
     """
     Test getting all reviewed kanji from Anki.
@@ -90,6 +95,7 @@ def test_get_reviewed_kanji():
 
     print(f"Successfully retrieved {len(kanji_set)} reviewed kanji")
 
+@pytest.mark.anki_live
 def test_get_reviewed_vocab():
     """
     Test getting all reviewed vocabulary from Anki.
@@ -100,11 +106,11 @@ def test_get_reviewed_vocab():
 
     Will fail if Anki isn't running or no vocab has been reviewed.
     """
-    # Get the reviewed vocab list
+    # Get the reviewed vocab set
     vocab_list = connect.get_reviewed_vocab()
 
-    # Check that we got back a list and it's not empty
-    assert isinstance(vocab_list, list), "get_reviewed_vocab should return a list"
+    # Check that we got back a frozen set and it's not empty
+    assert isinstance(vocab_list, frozenset), "get_reviewed_vocab should return a frozenset"
     assert len(vocab_list) > 0, "No vocabulary returned from get_reviewed_vocab"
 
     # If we got any vocab, check that they are non-empty strings
@@ -129,6 +135,7 @@ def kanji_card_with_restore():
     connect.send_request("setSpecificValueOfCard", card=card_id, keys=["due"], newValues=[original_due])
 
 
+@pytest.mark.anki_live
 def test_reposition_card_to_top(kanji_card_with_restore):
     """Test that reposition_card_to_top moves a card to due=0 in its queue."""
     card_id, original_due = kanji_card_with_restore
@@ -137,6 +144,7 @@ def test_reposition_card_to_top(kanji_card_with_restore):
     assert info[0]["due"] == 0
 
 
+@pytest.mark.anki_live
 def test_reposition_restores_correctly(kanji_card_with_restore):
     """Sanity check: the fixture restore actually works (due goes back to original)."""
     card_id, original_due = kanji_card_with_restore
@@ -147,6 +155,7 @@ def test_reposition_restores_correctly(kanji_card_with_restore):
     assert original_due != 0  # Confirm the card wasn't already at 0
 
 
+@pytest.mark.anki_live
 def test_find_kanji_card_id_returns_none_for_unknown():
     """Test that find_kanji_card_id returns None for a character not in the deck."""
     result = connect.find_kanji_card_id("X")
@@ -156,63 +165,417 @@ def test_find_kanji_card_id_returns_none_for_unknown():
 def test_prepare_note():
     """
     Test the prepare_note function for creating Anki note data.
-    This test relies on the live functionality of `fetch_jisho_word_furigana`
-    called within `prepare_note`.
-    """
-    # 1. Test with a standard word
-    sample_word_full = JishoWord(
-        expression="日本語",
-        kana="にほんご",
-        jlpt=3,
-        definitions=["Japanese language", "The spoken and written language of Japan."],
-        parts_of_speech=["Noun", "Proper Noun"]
-    )
 
-    # Call prepare_note - this will internally call fetch_jisho_word_furigana
-    prepared_note_full = connect.prepare_note(sample_word_full, set())
-
-    # Define expected output, assuming fetch_jisho_word_furigana("日本語", set()) -> "<ruby>日本語<rt>にほんご</rt></ruby>"
-    expected_note_full = {
-        "modelName": "MyJapaneseVocabulary",
-        "fields": {
-            "Front": "<ruby>日本語<rt>にほんご</rt></ruby>",
-            "Back": "Japanese language",
-            "Expression": "日本語",
-            "Kana Reading": "にほんご",
-            "Grammar": "Noun",
-            "Definition": "Japanese language",
-            "Additional Definitions": "The spoken and written language of Japan.",
-            "JLPT": "JLPT N3",
-        },
-        "tags": ["kanji-vocab-miner"],
-        "options": {"allowDuplicate": False},
+    Furigana scraping is stubbed with known markup; the live scrape is covered
+    by test_fetch_jisho_word_furigana in test_jisho_api.py.
+    """
+    furigana = {
+        "日本語": "<ruby>日本語<rt>にほんご</rt></ruby>",
+        "学ぶ": "<ruby>学<rt>まな</rt></ruby>ぶ",
     }
-    assert prepared_note_full == expected_note_full
-
-    # 2. Test with minimal definitions and parts_of_speech (single items)
-    sample_word_minimal = JishoWord(
-        expression="学ぶ",
-        kana="まなぶ",
-        jlpt=4,
-        definitions=["to learn"],
-        parts_of_speech=["Verb"]
+    with patch(
+        "kanji_vocab_miner.anki.connect.fetch_jisho_word_furigana",
+        side_effect=lambda word, reviewed_kanji: furigana[word],
+    ):
+        # 1. Test with a standard word
+        sample_word_full = JishoWord(
+            expression="日本語",
+            kana="にほんご",
+            jlpt=3,
+            definitions=["Japanese language", "The spoken and written language of Japan."],
+            parts_of_speech=["Noun", "Proper Noun"]
+        )
+
+        # Call prepare_note - the stub stands in for fetch_jisho_word_furigana
+        prepared_note_full = connect.prepare_note(sample_word_full, set())
+
+        # Define expected output, with the stubbed furigana as the Front field
+        expected_note_full = {
+            "modelName": "MyJapaneseVocabulary",
+            "fields": {
+                "Front": "<ruby>日本語<rt>にほんご</rt></ruby>",
+                "Back": "Japanese language",
+                "Expression": "日本語",
+                "Kana Reading": "にほんご",
+                "Grammar": "Noun",
+                "Definition": "Japanese language",
+                "Additional Definitions": "The spoken and written language of Japan.",
+                "JLPT": "JLPT N3",
+            },
+            "tags": ["kanji-vocab-miner"],
+            "options": {"allowDuplicate": False},
+        }
+        assert prepared_note_full == expected_note_full
+
+        # 2. Test with minimal definitions and parts_of_speech (single items)
+        sample_word_minimal = JishoWord(
+            expression="学ぶ",
+            kana="まなぶ",
+            jlpt=4,
+            definitions=["to learn"],
+            parts_of_speech=["Verb"]
+        )
+        prepared_note_minimal = connect.prepare_note(sample_word_minimal, set())
+
+        # Define expected output, with the stubbed furigana as the Front field
+        expected_note_minimal = {
+            "modelName": "MyJapaneseVocabulary",
+            "fields": {
+                "Front": "<ruby>学<rt>まな</rt></ruby>ぶ",
+                "Back": "to learn",
+                "Expression": "学ぶ",
+                "Kana Reading": "まなぶ",
+                "Grammar": "Verb",
+                "Definition": "to learn",
+                "Additional Definitions": "",  # Expect empty string if only one definition
+                "JLPT": "JLPT N4",
+            },
+            "tags": ["kanji-vocab-miner"],
+            "options": {"allowDuplicate": False},
+        }
+        assert prepared_note_minimal == expected_note_minimal
+
+
+def test_send_request_reuses_session():
+    """send_request should go through one shared session rather than a new connection per call."""
+    mock_response = MagicMock()
+    mock_response.content = b'{"result": 6, "error": null}'
+    mock_session = MagicMock()
+    mock_session.post.return_value = mock_response
+
+    with patch("kanji_vocab_miner.anki.connect.get_session", return_value=mock_session):
+        assert connect.send_request("version") == 6
+        assert connect.send_request("version") == 6
+
+    assert mock_session.post.call_count == 2
+    assert connect.get_session() is connect.get_session()
+
+
+def test_send_multi_batches_actions():
+    """send_multi should send one `multi` request and unwrap each sub-action result in order."""
+    actions = [connect.build_action("deckNames"), connect.build_action("modelNames")]
+    responses = [{"result": ["Default"], "error": None}, {"result": ["Basic"], "error": None}]
+
+    with patch("kanji_vocab_miner.anki.connect._post", return_value=responses) as mock_post:
+        result = connect.send_multi(actions)
+
+    mock_post.assert_called_once_with(
+        {"action": "multi", "version": 6, "params": {"actions": actions}}
     )
-    prepared_note_minimal = connect.prepare_note(sample_word_minimal, set())
-
-    # Define expected output, assuming fetch_jisho_word_furigana("学ぶ", set()) -> "<ruby>学<rt>まな</rt></ruby>ぶ"
-    expected_note_minimal = {
-        "modelName": "MyJapaneseVocabulary",
-        "fields": {
-            "Front": "<ruby>学<rt>まな</rt></ruby>ぶ",
-            "Back": "to learn",
-            "Expression": "学ぶ",
-            "Kana Reading": "まなぶ",
-            "Grammar": "Verb",
-            "Definition": "to learn",
-            "Additional Definitions": "",  # Expect empty string if only one definition
-            "JLPT": "JLPT N4",
-        },
-        "tags": ["kanji-vocab-miner"],
-        "options": {"allowDuplicate": False},
+    assert result == [["Default"], ["Basic"]]
+
+
+def test_send_multi_raises_on_sub_action_error():
+    """An error in any sub-action should surface with the failing action name."""
+    actions = [connect.build_action("deckNames"), connect.build_action("modelNames")]
+    responses = [{"result": ["Default"], "error": None}, {"result": None, "error": "boom"}]
+
+    with patch("kanji_vocab_miner.anki.connect._post", return_value=responses):
+        with pytest.raises(Exception, match="modelNames"):
+            connect.send_multi(actions)
+
+
+def test_add_vocab_note_to_deck_submits_one_batch(capsys):
+    """Notes are prepared concurrently but submitted in order, in a single multi request."""
+    words = [
+        JishoWord(expression=expr, kana="", jlpt=0, definitions=["x"])
+        for expr in ["学校", "大学", "学問"]
+    ]
+
+    def fake_prepare(word, reviewed_kanji):
+        return {"fields": {"Expression": word.expression}}
+
+    responses = [
+        {"result": 1, "error": None},
+        {"result": None, "error": "cannot create note because it is a duplicate"},
+        {"result": 3, "error": None},
+    ]
+
+    with patch("kanji_vocab_miner.anki.connect.prepare_note", side_effect=fake_prepare), \
+            patch("kanji_vocab_miner.anki.connect._send_multi_raw", return_value=responses) as mock_multi:
+        connect.add_vocab_note_to_deck(words, deckname="TestDeck")
+
+    mock_multi.assert_called_once()
+    sent = [action["params"]["note"]["fields"]["Expression"] for action in mock_multi.call_args.args[0]]
+    assert sent == ["学校", "大学", "学問"]
+    assert "Added 2 notes. Skipped 1 duplicate notes." in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "front_html, reviewed_kanji, expected",
+    [
+        # Legacy Anki notation is migrated to ruby HTML
+        ("学[がっ]校[こう]", {"学"}, ('<ruby>学<rt class="known">がっ</rt></ruby><ruby>校<rt>こう</rt></ruby>', True)),
+        # Existing ruby markup gains / loses the known class
+        ("<ruby>走<rt>はし</rt></ruby>る", {"走"}, ('<ruby>走<rt class="known">はし</rt></ruby>る', True)),
+        ('<ruby>走<rt class="known">はし</rt></ruby>る', set(), ("<ruby>走<rt>はし</rt></ruby>る", True)),
+        # Already up to date
+        ("<ruby>走<rt>はし</rt></ruby>る", set(), ("<ruby>走<rt>はし</rt></ruby>る", False)),
+        # Plain text is left alone
+        ("すし", set(), ("すし", False)),
+    ],
+)
+def test_update_furigana_classes(front_html, reviewed_kanji, expected):
+    """_update_furigana_classes migrates legacy notation and syncs the known class."""
+    assert connect._update_furigana_classes(front_html, reviewed_kanji) == expected
+
+
+def test_extract_kanji_from_cards():
+    """Only a leading kanji in the front field is extracted."""
+    cards = [
+        {"fields": {"Front": {"value": "山", "order": 0}}},
+        {"fields": {"Front": {"value": "やま", "order": 0}}},
+        {"fields": {"Front": {"value": "", "order": 0}}},
+        {"fields": {"Back": {"value": "川", "order": 0}}},
+        {"fields": {"Card Front": {"value": "火山", "order": 0}}},
+    ]
+    assert connect.extract_kanji_from_cards(cards) == ["山", "火"]
+
+
+def test_iter_notes_info_fetches_in_chunks():
+    """notesInfo is requested in NOTES_INFO_CHUNK_SIZE slices and yielded in order."""
+    note_ids = list(range(1, 1201))
+
+    def fake_send_request(action, notes):
+        return [{"noteId": note_id} for note_id in notes]
+
+    with patch("kanji_vocab_miner.anki.connect.send_request", side_effect=fake_send_request) as mock_send:
+        notes = list(connect.iter_notes_info(note_ids))
+
+    chunk_sizes = [len(call.kwargs["notes"]) for call in mock_send.call_args_list]
+    assert chunk_sizes == [500, 500, 200]
+    assert [note["noteId"] for note in notes] == note_ids
+
+
+def test_send_request_caches_reads_until_a_write():
+    """Repeated read-only requests are served from cache; a write invalidates it."""
+    connect.clear_request_cache()
+    with patch("kanji_vocab_miner.anki.connect._post", return_value=[1, 2]) as mock_post:
+        assert connect.send_request("findNotes", query="deck:Test") == [1, 2]
+        assert connect.send_request("findNotes", query="deck:Test") == [1, 2]
+        assert mock_post.call_count == 1
+
+        connect.send_request("updateNote", note={"id": 1, "fields": {}})
+        connect.send_request("findNotes", query="deck:Test")
+        assert mock_post.call_count == 3
+    connect.clear_request_cache()
+
+
+def test_uncached_reads_do_not_evict_cached_results():
+    """notesInfo and guiCurrentCard are not cached, but they don't clear the cache either."""
+    connect.clear_request_cache()
+    with patch("kanji_vocab_miner.anki.connect._post", return_value=[1, 2]) as mock_post:
+        connect.send_request("findNotes", query="deck:Test")
+        connect.send_request("notesInfo", notes=[1, 2])
+        connect.send_request("guiCurrentCard")
+        connect.send_request("findNotes", query="deck:Test")
+        assert mock_post.call_count == 3
+    connect.clear_request_cache()
+
+
+def test_read_only_multi_keeps_cached_results():
+    """A multi batch of reads leaves the cache intact; one with a write clears it."""
+    connect.clear_request_cache()
+    responses = [{"result": 1, "error": None}, {"result": 2, "error": None}]
+    with patch("kanji_vocab_miner.anki.connect._post", return_value=responses) as mock_post:
+        connect.send_request("findNotes", query="deck:Test")
+        connect.send_multi([connect.build_action("version"), connect.build_action("deckNames")])
+        connect.send_request("findNotes", query="deck:Test")
+        assert mock_post.call_count == 2
+
+        connect._send_multi_raw([connect.build_action("addNote", note={})])
+        connect.send_request("findNotes", query="deck:Test")
+        assert mock_post.call_count == 4
+    connect.clear_request_cache()
+
+
+def test_iter_notes_info_does_not_retain_chunks():
+    """Streamed notesInfo chunks are not held in the request cache."""
+    connect.clear_request_cache()
+    with patch("kanji_vocab_miner.anki.connect._post", return_value=[{"noteId": 1}]):
+        list(connect.iter_notes_info([1]))
+    assert connect._request_cache == {}
+
+
+def test_prepare_note_without_definitions_raises():
+    """A word with no definitions fails with a clear message before any Jisho lookup."""
+    word = JishoWord(expression="学校", kana="がっこう", jlpt=5, definitions=[])
+    with patch("kanji_vocab_miner.anki.connect.fetch_jisho_word_furigana") as mock_furigana:
+        with pytest.raises(ValueError, match="学校"):
+            connect.prepare_note(word, set())
+    mock_furigana.assert_not_called()
+
+
+def test_add_vocab_note_to_deck_skips_repeated_selections(capsys):
+    """A word selected twice is only prepared once and counted as a duplicate."""
+    word = JishoWord(expression="学校", kana="がっこう", jlpt=5, definitions=["school"])
+
+    with patch("kanji_vocab_miner.anki.connect.prepare_note", return_value={"fields": {}}) as mock_prepare, \
+            patch("kanji_vocab_miner.anki.connect._send_multi_raw", return_value=[{"result": 1, "error": None}]):
+        connect.add_vocab_note_to_deck([word, word], deckname="TestDeck")
+
+    assert mock_prepare.call_count == 1
+    assert "Added 1 notes. Skipped 1 duplicate notes." in capsys.readouterr().out
+
+
+def _fake_kanji_deck(notes, note_ids, edited_ids):
+    """Build a send_request stand-in for a kanji deck of {note_id: (kanji, mod)}."""
+    def fake_send_request(action, **params):
+        if action == "findNotes":
+            return list(edited_ids if "edited:" in params["query"] else note_ids)
+        return [
+            {"noteId": n, "mod": notes[n][1], "fields": {"Kanji": {"value": notes[n][0], "order": 0}}}
+            for n in params["notes"]
+        ]
+    return fake_send_request
+
+
+def test_get_reviewed_kanji_reuses_disk_cache(tmp_path):
+    """A second run only fetches note info for notes the cache hasn't seen."""
+    notes = {1: ("山", 100), 2: ("川", 100), 3: ("火", 100), 4: ("<br>", 100)}
+    note_ids = [1, 2, 4]
+
+    connect.invalidate_reviewed_kanji()
+    with patch("kanji_vocab_miner.anki.connect.get_cache_dir", return_value=tmp_path), \
+            patch("kanji_vocab_miner.anki.connect.send_request",
+                  side_effect=_fake_kanji_deck(notes, note_ids, [])) as mock_send:
+        assert connect.get_reviewed_kanji() == {"山", "川"}
+
+        # The blank note is remembered on disk but never reported as reviewed
+        note_ids.append(3)
+        mock_send.reset_mock()
+        connect.invalidate_reviewed_kanji()
+        assert connect.get_reviewed_kanji() == {"山", "川", "火"}
+    connect.invalidate_reviewed_kanji()
+
+    notes_info_calls = [c for c in mock_send.call_args_list if c.args[0] == "notesInfo"]
+    assert [c.kwargs["notes"] for c in notes_info_calls] == [[3]]
+
+
+def test_get_reviewed_kanji_refetches_edited_notes(tmp_path):
+    """Notes edited since the newest cached mod time are fetched again."""
+    notes = {1: ("山", 100), 2: ("川", 100)}
+    edited_ids = []
+
+    connect.invalidate_reviewed_kanji()
+    with patch("kanji_vocab_miner.anki.connect.get_cache_dir", return_value=tmp_path), \
+            patch("kanji_vocab_miner.anki.connect.send_request",
+                  side_effect=_fake_kanji_deck(notes, [1, 2], edited_ids)) as mock_send:
+        assert connect.get_reviewed_kanji() == {"山", "川"}
+
+        notes[2] = ("水", 200)
+        edited_ids.append(2)
+        mock_send.reset_mock()
+        connect.invalidate_reviewed_kanji()
+        assert connect.get_reviewed_kanji() == {"山", "水"}
+    connect.invalidate_reviewed_kanji()
+
+    notes_info_calls = [c for c in mock_send.call_args_list if c.args[0] == "notesInfo"]
+    assert [c.kwargs["notes"] for c in notes_info_calls] == [[2]]
+    edited_query = mock_send.call_args_list[1].kwargs["query"]
+    assert edited_query.endswith(f"edited:{connect._edited_since_days(100)}")
+
+
+def test_disabled_cache_lookups_refetch_reviewed_kanji(tmp_path):
+    """With lookups disabled every note is fetched, but the cache is still refreshed."""
+    notes = {1: ("山", 100), 2: ("川", 100)}
+
+    connect.invalidate_reviewed_kanji()
+    with patch("kanji_vocab_miner.anki.connect.get_cache_dir", return_value=tmp_path), \
+            patch("kanji_vocab_miner.anki.connect.send_request",
+                  side_effect=_fake_kanji_deck(notes, [1, 2], [])) as mock_send:
+        connect.get_reviewed_kanji()
+        connect.set_cache_lookups_enabled(False)
+        try:
+            mock_send.reset_mock()
+            connect.invalidate_reviewed_kanji()
+            assert connect.get_reviewed_kanji() == {"山", "川"}
+        finally:
+            connect.set_cache_lookups_enabled(True)
+    connect.invalidate_reviewed_kanji()
+
+    notes_info_calls = [c for c in mock_send.call_args_list if c.args[0] == "notesInfo"]
+    assert [c.kwargs["notes"] for c in notes_info_calls] == [[1, 2]]
+    assert (tmp_path / connect.REVIEWED_KANJI_CACHE_FILE).exists()
+
+
+def test_get_reviewed_vocab_cleans_editor_markup():
+    """Expression values lose editor <div>/<br> wrappers; blank ones are dropped."""
+    notes_info = [
+        {"noteId": 1, "fields": {"Expression": {"value": "学校", "order": 0}}},
+        {"noteId": 2, "fields": {"Expression": {"value": "<div>大学</div><br>", "order": 0}}},
+        {"noteId": 3, "fields": {"Expression": {"value": " <br> ", "order": 0}}},
+        {"noteId": 4, "fields": {"Front": {"value": "言語", "order": 0}}},
+    ]
+
+    def fake_send_request(action, **params):
+        return [1, 2, 3, 4] if action == "findNotes" else notes_info
+
+    connect.invalidate_reviewed_vocab()
+    with patch("kanji_vocab_miner.anki.connect.send_request", side_effect=fake_send_request):
+        assert connect.get_reviewed_vocab() == {"学校", "大学"}
+    connect.invalidate_reviewed_vocab()
+
+
+def test_get_reviewed_vocab_is_refreshed_after_adding_notes():
+    """Reviewed vocab is fetched once and re-read only after a successful add."""
+    word = JishoWord(expression="大学", kana="だいがく", jlpt=5, definitions=["university"])
+    deck = ["学校"]
+
+    def fake_send_request(action, **params):
+        if action == "findNotes":
+            return list(range(len(deck)))
+        return [{"noteId": n, "fields": {"Expression": {"value": deck[n], "order": 0}}} for n in params["notes"]]
+
+    def fake_multi(actions):
+        deck.append(word.expression)
+        return [{"result": 1, "error": None}]
+
+    connect.invalidate_reviewed_vocab()
+    with patch("kanji_vocab_miner.anki.connect.send_request", side_effect=fake_send_request) as mock_send, \
+            patch("kanji_vocab_miner.anki.connect.prepare_note", return_value={"fields": {}}), \
+            patch("kanji_vocab_miner.anki.connect._send_multi_raw", side_effect=fake_multi):
+        assert connect.get_reviewed_vocab() == {"学校"}
+        assert connect.get_reviewed_vocab() == {"学校"}
+        assert mock_send.call_count == 2  # one findNotes, one notesInfo
+
+        connect.add_vocab_note_to_deck([word], deckname="TestDeck")
+        assert connect.get_reviewed_vocab() == {"学校", "大学"}
+    connect.invalidate_reviewed_vocab()
+
+
+def test_get_current_card_cleans_kanji_field():
+    """The current card's Kanji field is returned without editor markup."""
+    field_names = [
+        field.alias or name for name, field in KanjiFields.model_fields.items()
+    ]
+    card_info = {
+        "cardId": 1,
+        "note": 2,
+        "modelName": "All in One Kanji",
+        "deckName": "Kanji",
+        "ord": 0,
+        "type": 2,
+        "mod": 0,
+        "fields": {name: {"value": "", "order": i} for i, name in enumerate(field_names)},
     }
-    assert prepared_note_minimal == expected_note_minimal
+    card_info["fields"]["Kanji"]["value"] = "<DIV>山</DIV><br />"
+
+    with patch("kanji_vocab_miner.anki.connect.send_request", return_value={"cardId": 1}), \
+            patch("kanji_vocab_miner.anki.connect._get_card_info", return_value=card_info):
+        card = connect.get_current_card()
+
+    assert card.fields.Kanji.value == "山"
+
+
+def test_get_reviewed_kanji_is_memoized_but_not_on_failure():
+    """Successful lookups are shared in-process; failures are retried on the next call."""
+    connect.invalidate_reviewed_kanji()
+    with patch("kanji_vocab_miner.anki.connect.send_request", side_effect=Exception("Anki closed")):
+        assert connect.get_reviewed_kanji() == frozenset()
+
+    with patch("kanji_vocab_miner.anki.connect.send_request", return_value=[]) as mock_send:
+        assert connect.get_reviewed_kanji() == frozenset()
+        assert connect.get_reviewed_kanji() == frozenset()
+    assert mock_send.call_count == 1
+    connect.invalidate_reviewed_kanji()
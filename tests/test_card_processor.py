@@ -1,12 +1,19 @@
+import random
+from unittest.mock import patch
 import pytest
 from kanji_vocab_miner import card_processor
 from kanji_vocab_miner.jisho import JishoWord
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def unordered_words():
-    """Fixture providing sample words with varying JLPT levels and Kanji combinations."""
-    return [
+    """
+    Fixture providing sample words with varying JLPT levels and Kanji combinations.
+
+    Built once per module and returned as a tuple, since sorting must not
+    reorder the caller's words.
+    """
+    return (
         # Word with no JLPT level (should be 4th)
         JishoWord(
             expression="学問",
@@ -35,7 +42,7 @@ def unordered_words():
             jlpt=5,
             definitions=["university"],
         ),
-    ]
+    )
 
 
 def test_sort_and_limit_words(unordered_words):
@@ -62,3 +69,84 @@ def test_sort_and_limit_words_empty_list():
     """Test that sort_and_limit_words handles an empty list gracefully."""
     result = card_processor.sort_and_limit_words([], original_kanji="学", limit=10)
     assert result == [], "Empty input should return empty output"
+
+
+def test_sort_and_limit_words_uses_provided_reviewed_kanji(unordered_words):
+    """A caller-supplied reviewed set is used instead of querying Anki."""
+    with patch("kanji_vocab_miner.card_processor.connect.get_reviewed_kanji") as mock_reviewed:
+        result = card_processor.sort_and_limit_words(
+            unordered_words, original_kanji="学", limit=10, reviewed_kanji={"言", "語"}
+        )
+
+    mock_reviewed.assert_not_called()
+    assert [word.expression for word, _ in result][0] == "言語"
+
+
+def test_sort_and_limit_words_keeps_input_order_for_ties():
+    """Words of equal priority and JLPT level keep their input order."""
+    words = [
+        JishoWord(expression=expression, kana="", jlpt=3, definitions=["x"])
+        for expression in ["学生", "学者", "学期"]
+    ]
+    result = card_processor.sort_and_limit_words(
+        words, original_kanji="学", limit=2, reviewed_kanji=set()
+    )
+    assert [word.expression for word, _ in result] == ["学生", "学者"]
+
+
+def test_sort_and_limit_words_drops_the_original_kanji(unordered_words):
+    """The searched Kanji on its own is not offered as a vocabulary word."""
+    words = [JishoWord(expression="学", kana="がく", jlpt=3, definitions=["study"]), *unordered_words]
+    result = card_processor.sort_and_limit_words(
+        words, original_kanji="学", limit=10, reviewed_kanji=set()
+    )
+    assert "学" not in [word.expression for word, _ in result]
+    assert len(result) == len(unordered_words)
+
+
+def test_sort_and_limit_words_limit_matches_full_ordering():
+    """Limiting the result returns the head of the full ordering."""
+    words = [
+        JishoWord(expression=f"学{chr(0x4E00 + i)}", kana="", jlpt=i % 6, definitions=["x"])
+        for i in range(50)
+    ]
+    reviewed = {chr(0x4E00 + i) for i in range(0, 50, 3)}
+
+    full = card_processor.sort_and_limit_words(
+        words, original_kanji="学", limit=len(words), reviewed_kanji=reviewed
+    )
+    top = card_processor.sort_and_limit_words(
+        words, original_kanji="学", limit=10, reviewed_kanji=reviewed
+    )
+    assert top == full[:10]
+
+
+def test_sort_and_limit_words_matches_reference_ordering():
+    """Random inputs rank like a stable sort on (priority, JLPT), both descending."""
+    rng = random.Random(0)
+    pool = "学校大言語生者期山川"
+    for _ in range(200):
+        words = [
+            JishoWord(
+                expression="".join(rng.choices(pool, k=rng.randint(1, 3))),
+                kana="",
+                jlpt=rng.randint(0, 5),
+                definitions=["x"],
+            )
+            for _ in range(rng.randint(0, 15))
+        ]
+        reviewed = set(rng.sample(pool, rng.randint(0, len(pool))))
+        limit = rng.randint(0, 20)
+
+        candidates = [word for word in words if word.expression != "学"]
+        priority = {
+            id(word): int(reviewed.issuperset(word.expression.replace("学", "")))
+            for word in candidates
+        }
+        expected = sorted(candidates, key=lambda w: (-priority[id(w)], -w.jlpt))[:limit]
+
+        result = card_processor.sort_and_limit_words(
+            words, original_kanji="学", limit=limit, reviewed_kanji=reviewed
+        )
+        assert [word for word, _ in result] == expected
+        assert [p for _, p in result] == [priority[id(word)] for word in expected]
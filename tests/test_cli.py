@@ -0,0 +1,33 @@
+from unittest.mock import patch
+import pytest
+from kanji_vocab_miner import cli
+from kanji_vocab_miner.jisho import JishoWord
+
+
+@pytest.fixture
+def school():
+    """A word returned by the dictionary lookup."""
+    return JishoWord(expression="学校", kana="がっこう", jlpt=5, definitions=["school"])
+
+
+def test_process_word_lookup_skips_words_already_in_deck(school):
+    """A typed word that is already in the deck is reported, not offered for adding."""
+    with patch("kanji_vocab_miner.cli.fetch_word_from_word", return_value=school), \
+            patch("kanji_vocab_miner.cli.ankiconnect.get_reviewed_vocab", return_value=frozenset({"学校"})), \
+            patch("kanji_vocab_miner.cli.normalized_confirm") as mock_confirm, \
+            patch("kanji_vocab_miner.cli.info") as mock_info:
+        pending = cli.process_word_lookup("学校", [])
+
+    assert pending == []
+    mock_confirm.assert_not_called()
+    mock_info.assert_called_once_with("学校 is already in your deck.")
+
+
+def test_process_word_lookup_adds_confirmed_new_word(school):
+    """A typed word that is neither pending nor in the deck is added once confirmed."""
+    with patch("kanji_vocab_miner.cli.fetch_word_from_word", return_value=school), \
+            patch("kanji_vocab_miner.cli.ankiconnect.get_reviewed_vocab", return_value=frozenset()), \
+            patch("kanji_vocab_miner.cli.normalized_confirm", return_value=True):
+        pending = cli.process_word_lookup("学校", [])
+
+    assert pending == [school]
@@ -19,8 +19,9 @@ def test_load_config_defaults():
         config = load_config()
 
         # Verify we got a config object with defaults
-        assert config.ankiconnect.url == "http://localhost:8765"
+        assert config.ankiconnect.url == "http://127.0.0.1:8765"
         assert config.kanji_deck.name == "All in One Kanji"
+        assert config.jamdict.memory_mode is False
 
 
 def test_load_config_from_file(tmp_path):
@@ -32,6 +33,9 @@ def test_load_config_from_file(tmp_path):
 
         [kanji_deck]
         name = "My Custom Kanji Deck"
+
+        [jamdict]
+        memory_mode = true
         """
     config_file.write_text(config_content)
 
@@ -41,6 +45,7 @@ def test_load_config_from_file(tmp_path):
 
         assert config.ankiconnect.url == "http://localhost:9999"
         assert config.kanji_deck.name == "My Custom Kanji Deck"
+        assert config.jamdict.memory_mode is True
 
 
 def test_vocab_constants_defined():
@@ -3,12 +3,40 @@ import requests
 import json
 import jsonschema
 import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 from kanji_vocab_miner import jisho
 
 from typing import List
 
 
+@pytest.fixture(autouse=True)
+def clear_furigana_cache():
+    """Keep the furigana scrape cache from leaking mocked pages between tests."""
+    jisho._fetch_furigana_parts.cache_clear()
+    yield
+    jisho._fetch_furigana_parts.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_search_cache(tmp_path):
+    """Point the on-disk Jisho caches at a per-test directory."""
+    with patch("kanji_vocab_miner.jisho.get_cache_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture(scope="module")
+def jisho_words_validator():
+    """Load and check the Jisho word-search schema once for the module."""
+    schema_path = os.path.join(os.path.dirname(__file__), "jisho_words_schema.json")
+    with open(schema_path, "r") as schema_file:
+        schema = json.load(schema_file)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 def _make_furigana_response(characters: str, furigana: list[str]) -> MagicMock:
     """Build a mock requests.Response whose HTML looks like a Jisho word page."""
     kanji_spans = "".join(f'<span class="kanji">{f}</span>' for f in furigana)
@@ -23,7 +51,8 @@ def _make_furigana_response(characters: str, furigana: list[str]) -> MagicMock:
     return mock_response
 
 
-def test_fetch_jisho_data():
+@pytest.mark.remote_data
+def test_fetch_jisho_data(jisho_words_validator):
     """Test that fetch_jisho_data returns a valid response for a simple kanji query."""
     # Test with the kanji for "mountain" (山)
     kanji = "山"
@@ -46,15 +75,13 @@ def test_fetch_jisho_data():
         assert isinstance(result["data"], list)
 
         # Validate against schema
-        schema_path = os.path.join(os.path.dirname(__file__), "jisho_words_schema.json")
-        with open(schema_path, "r") as schema_file:
-            schema = json.load(schema_file)
-            jsonschema.validate(instance=result, schema=schema)
+        jisho_words_validator.validate(result)
 
     except Exception as e:
         pytest.fail(f"fetch_jisho_data raised an exception: {e}")
 
 
+@pytest.mark.remote_data
 def test_search_words():
     """Test that search_words correctly processes the Jisho API response."""
     kanji = "山"
@@ -75,6 +102,7 @@ def test_search_words():
     )
 
 
+@pytest.mark.remote_data
 @pytest.mark.parametrize(
     "word, expected",
     [
@@ -151,7 +179,7 @@ def test_fetch_jisho_word_furigana(word, expected):
 )
 def test_furigana_known_kanji_markup(characters, furigana, reviewed_kanji, expected):
     """Test that fetch_jisho_word_furigana applies class="known" exactly to reviewed kanji."""
-    with patch("kanji_vocab_miner.jisho.requests.get", return_value=_make_furigana_response(characters, furigana)):
+    with patch.object(jisho.get_session(), "get", return_value=_make_furigana_response(characters, furigana)):
         result = jisho.fetch_jisho_word_furigana(characters, reviewed_kanji)
     assert result == expected
 
@@ -215,3 +243,149 @@ def test_parse_kanji_summary_from_html():
     assert summary.kun_readings == ["やま"]
     assert summary.on_readings == ["サン", "セン"]
     assert summary.jlpt == 5
+
+
+def test_furigana_lookup_is_cached():
+    """Repeated furigana lookups for the same word only scrape Jisho once."""
+    mock_get = MagicMock(return_value=_make_furigana_response("学校", ["がっ", "こう"]))
+    with patch.object(jisho.get_session(), "get", mock_get):
+        first = jisho.fetch_jisho_word_furigana("学校", set())
+        second = jisho.fetch_jisho_word_furigana("学校", {"学"})
+
+    assert mock_get.call_count == 1
+    assert first == "<ruby>学<rt>がっ</rt></ruby><ruby>校<rt>こう</rt></ruby>"
+    assert second == '<ruby>学<rt class="known">がっ</rt></ruby><ruby>校<rt>こう</rt></ruby>'
+
+
+def test_word_search_is_cached_on_disk(isolated_search_cache):
+    """A repeat search is read from disk until the cached copy expires."""
+    mock_response = MagicMock()
+    mock_response.content = b'{"meta": {"status": 200}, "data": []}'
+    mock_get = MagicMock(return_value=mock_response)
+
+    with patch.object(jisho.get_session(), "get", mock_get):
+        assert jisho.fetch_jisho_word_search("山") == {"meta": {"status": 200}, "data": []}
+        jisho.fetch_jisho_word_search("山")
+        assert mock_get.call_count == 1
+
+        # Age the cached file past the TTL
+        cache_file = jisho._cache_path(jisho.SEARCH_CACHE_SUBDIR, "山")
+        expired = cache_file.stat().st_mtime - jisho.CACHE_TTL - 1
+        os.utime(cache_file, (expired, expired))
+        jisho.fetch_jisho_word_search("山")
+        assert mock_get.call_count == 2
+
+
+def test_word_search_cache_drops_expired_entries(isolated_search_cache):
+    """The first save into a cache directory removes responses that have expired."""
+    old_file = jisho._cache_path(jisho.SEARCH_CACHE_SUBDIR, "山")
+    old_file.parent.mkdir(parents=True)
+    old_file.write_bytes(b"{}")
+    expired = old_file.stat().st_mtime - jisho.CACHE_TTL - 1
+    os.utime(old_file, (expired, expired))
+
+    jisho._save_cached(jisho.SEARCH_CACHE_SUBDIR, "川", b"{}")
+
+    assert not old_file.exists()
+    assert jisho._cache_path(jisho.SEARCH_CACHE_SUBDIR, "川").exists()
+
+
+def test_word_search_cache_prunes_once_per_directory(isolated_search_cache, capsys):
+    """Later saves skip the sweep, and a file vanishing mid-sweep still saves."""
+    cache_dir = isolated_search_cache / jisho.SEARCH_CACHE_SUBDIR
+    jisho._save_cached(jisho.SEARCH_CACHE_SUBDIR, "山", b"{}")
+    with patch.object(Path, "glob") as mock_glob:
+        jisho._save_cached(jisho.SEARCH_CACHE_SUBDIR, "川", b"{}")
+    mock_glob.assert_not_called()
+
+    jisho._pruned_cache_dirs.discard(cache_dir)
+    vanished = cache_dir / "vanished.json"
+    with patch.object(Path, "glob", return_value=[vanished]):
+        jisho._save_cached(jisho.SEARCH_CACHE_SUBDIR, "海", b"{}")
+    assert jisho._cache_path(jisho.SEARCH_CACHE_SUBDIR, "海").exists()
+    assert "Warning" not in capsys.readouterr().out
+
+
+def test_furigana_parts_are_cached_on_disk():
+    """A new process reuses scraped furigana instead of fetching the page again."""
+    mock_get = MagicMock(return_value=_make_furigana_response("学校", ["がっ", "こう"]))
+    with patch.object(jisho.get_session(), "get", mock_get):
+        jisho.fetch_jisho_word_furigana("学校", set())
+        # Drop the in-memory cache to simulate the next run
+        jisho._fetch_furigana_parts.cache_clear()
+        result = jisho.fetch_jisho_word_furigana("学校", set())
+
+    assert mock_get.call_count == 1
+    assert result == "<ruby>学<rt>がっ</rt></ruby><ruby>校<rt>こう</rt></ruby>"
+
+
+def test_disabled_cache_lookups_refetch_search():
+    """With lookups disabled, searches hit the network but still refresh the cache."""
+    mock_response = MagicMock()
+    mock_response.content = b'{"meta": {"status": 200}, "data": []}'
+    mock_get = MagicMock(return_value=mock_response)
+
+    jisho.set_cache_lookups_enabled(False)
+    try:
+        with patch.object(jisho.get_session(), "get", mock_get):
+            jisho.fetch_jisho_word_search("山")
+            jisho.fetch_jisho_word_search("山")
+    finally:
+        jisho.set_cache_lookups_enabled(True)
+
+    assert mock_get.call_count == 2
+    assert jisho._cache_path(jisho.SEARCH_CACHE_SUBDIR, "山").exists()
+
+
+def test_furigana_uses_first_representation_in_page():
+    """Only the first word representation is read, whatever surrounds it."""
+    html = """
+    <span class="text">ignored</span>
+    <div class="concept_light-representation main">
+        <span class="furigana"><span class="kanji">やま</span></span>
+        <span class="text">山</span>
+    </div>
+    <div class="concept_light-representation">
+        <span class="furigana"><span class="kanji">さん</span></span>
+        <span class="text">山</span>
+    </div>
+    """
+    mock_response = MagicMock()
+    mock_response.text = html
+    with patch.object(jisho.get_session(), "get", return_value=mock_response):
+        assert jisho.fetch_jisho_word_furigana("山", set()) == "<ruby>山<rt>やま</rt></ruby>"
+
+
+def test_search_words_parses_jlpt_tags_and_senses():
+    """JLPT comes from the first jlpt-nX tag; senses fill both lists in order."""
+    data = {
+        "data": [
+            {
+                "japanese": [{"word": "学校", "reading": "がっこう"}],
+                "jlpt": ["wanikani5", "jlpt-n5", "jlpt-n4"],
+                "senses": [
+                    {"english_definitions": ["school"], "parts_of_speech": ["Noun"]},
+                    {"english_definitions": ["academy", "college"]},
+                ],
+            },
+            {"japanese": [{"word": "大学", "reading": "だいがく"}]},
+            {"japanese": [{"reading": "がく"}]},
+        ]
+    }
+    with patch.object(jisho, "fetch_jisho_word_search", return_value=data):
+        words = jisho.search_words_containing_kanji("学")
+
+    assert [w.expression for w in words] == ["学校", "大学"]
+    assert words[0].jlpt == 5
+    assert words[0].definitions == ["school", "academy; college"]
+    assert words[0].parts_of_speech == ["Noun", ""]
+    assert words[1].jlpt == 0
+    assert words[1].definitions == []
+
+
+def test_get_session_is_shared_across_threads():
+    """Worker threads racing on the first request all get the same session."""
+    jisho.close_session()
+    with ThreadPoolExecutor(max_workers=jisho.SESSION_POOL_SIZE) as executor:
+        sessions = list(executor.map(lambda _: jisho.get_session(), range(32)))
+    assert all(session is sessions[0] for session in sessions)
@@ -0,0 +1,43 @@
+"""Tests for setup prerequisite validation."""
+
+from unittest.mock import patch
+
+from kanji_vocab_miner import setup
+from kanji_vocab_miner.config import AppConfig, VOCAB_DECK_NAME, VOCAB_NOTE_TYPE
+
+
+def test_validate_prerequisites_uses_one_round_trip():
+    """Connectivity, deck and note type checks are answered by a single multi request."""
+    results = [6, [VOCAB_DECK_NAME, "All in One Kanji"], [VOCAB_NOTE_TYPE]]
+
+    with patch("kanji_vocab_miner.setup.load_config", return_value=AppConfig()), \
+            patch("kanji_vocab_miner.setup.connect.send_multi", return_value=results) as mock_multi, \
+            patch("kanji_vocab_miner.setup.connect.send_request") as mock_send:
+        is_valid, errors = setup.validate_prerequisites()
+
+    assert is_valid
+    assert errors == []
+    mock_multi.assert_called_once()
+    mock_send.assert_not_called()
+
+
+def test_validate_prerequisites_reports_missing_decks():
+    """Each missing deck or note type is reported separately."""
+    results = [6, ["Default"], ["Basic"]]
+
+    with patch("kanji_vocab_miner.setup.load_config", return_value=AppConfig()), \
+            patch("kanji_vocab_miner.setup.connect.send_multi", return_value=results):
+        is_valid, errors = setup.validate_prerequisites()
+
+    assert not is_valid
+    assert len(errors) == 3
+
+
+def test_validate_prerequisites_without_anki():
+    """A failed batch is reported as a connectivity problem."""
+    with patch("kanji_vocab_miner.setup.load_config", return_value=AppConfig()), \
+            patch("kanji_vocab_miner.setup.connect.send_multi", side_effect=Exception("refused")):
+        is_valid, errors = setup.validate_prerequisites()
+
+    assert not is_valid
+    assert "Cannot connect to AnkiConnect" in errors[0]